@@ -32,16 +32,20 @@ setup(
     install_requires=[
         "httpx>=0.24.0",
         "pydantic>=2.0.0",
+        "typing_extensions>=4.6.0",
     ],
     extras_require={
         "dev": [
             "pytest>=7.0.0",
-            "pytest-asyncio>=0.21.0",
+            "pytest-asyncio>=0.26.0",
             "pytest-cov>=4.0.0",
+            "pytest-xdist>=3.0.0",
             "black>=23.0.0",
             "isort>=5.12.0",
             "mypy>=1.0.0",
             "ruff>=0.1.0",
         ],
+        "http2": ["httpx[http2]"],
+        "speedups": ["orjson>=3.0.0"],
     },
 )
@@ -27,6 +27,7 @@ from .models import (
     Comment,
     Folder,
     Guest,
+    ListViewsResult,
     Space,
     Status,
     Tag,
@@ -36,6 +37,7 @@ from .models import (
     View,
     Webhook,
     Workspace,
+    WorkspaceBundle,
 )
 from .utils import convert_to_timestamp, human_readable_time, parse_time_to_milliseconds
 
@@ -52,6 +54,7 @@ __all__ = [
     "ValidationError",
     # Models
     "Workspace",
+    "WorkspaceBundle",
     "Space",
     "Folder",
     "TaskList",
@@ -61,6 +64,7 @@ __all__ = [
     "Checklist",
     "Status",
     "View",
+    "ListViewsResult",
     "Webhook",
     "Tag",
     "Guest",
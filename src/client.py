@@ -5,7 +5,9 @@ This module contains the main ClickUp client class for interacting with the Clic
 """
 
 import asyncio
+import json
 import logging
+import os
 from datetime import datetime
 from typing import Any, Dict, Optional
 
@@ -35,6 +37,38 @@ from .resources.view import ViewResource
 from .resources.webhook import WebhookResource
 from .resources.workspace import WorkspaceResource
 
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+_MAX_BACKOFF = 30.0
+
+try:  # HTTP/2 needs the optional h2 package (pip install clickup-async[http2])
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# orjson is an optional speedup for request and response bodies
+# (pip install clickup-async[speedups])
+try:
+    import orjson
+
+    def _encode_json(data: Any) -> bytes:
+        """Serialize a request body to compact UTF-8 JSON."""
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+    _decode_json = orjson.loads
+
+except ImportError:
+
+    def _encode_json(data: Any) -> bytes:
+        """Serialize a request body to compact UTF-8 JSON."""
+        return json.dumps(
+            data, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+        ).encode("utf-8")
+
+    _decode_json = json.loads
+
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("clickup")
@@ -69,6 +103,15 @@ class ClickUp:
         retry_delay: float = 1.0,
         retry_rate_limited_requests: bool = True,
         rate_limit_buffer: int = 5,
+        max_concurrency: int = 50,
+        cache_ttl: float = 30.0,
+        cache_maxsize: int = 1024,
+        metadata_cache_ttl: float = 60.0,
+        running_entry_ttl: float = 2.0,
+        running_entry_max_age: float = 30.0,
+        partial_updates: bool = False,
+        fast_construct: Optional[bool] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         """Initialize the ClickUp client."""
         self.api_token = api_token
@@ -78,8 +121,41 @@ class ClickUp:
         self.retry_delay = retry_delay
         self.retry_rate_limited_requests = retry_rate_limited_requests
         self.rate_limit_buffer = rate_limit_buffer
-
-        self._client = httpx.AsyncClient(timeout=timeout)
+        self.max_concurrency = max_concurrency
+        # Response cache settings used by resources that cache GET responses
+        self.cache_ttl = cache_ttl
+        self.cache_maxsize = cache_maxsize
+        # Seconds custom task types and workspace custom fields are reused
+        self.metadata_cache_ttl = metadata_cache_ttl
+        # Seconds a cached running timer is served as-is, and the age after which
+        # time.get_running_entry blocks on a fresh fetch instead of refreshing it
+        # in the background
+        self.running_entry_ttl = running_entry_ttl
+        self.running_entry_max_age = running_entry_max_age
+        # Send only the changed fields when updating views, without a pre-fetch
+        self.partial_updates = partial_updates
+        # Trust API data and build models without validating it (opt-in; also
+        # enabled by CLICKUP_TRUST_API=1 when not passed)
+        if fast_construct is None:
+            fast_construct = os.getenv("CLICKUP_TRUST_API") == "1"
+        self.fast_construct = fast_construct
+
+        # One pooled client for every resource, so connections are kept alive. A
+        # caller-supplied client is shared as-is and left open by close().
+        self._owns_http_client = http_client is None
+        self._client = http_client or httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=300,
+            ),
+            timeout=httpx.Timeout(timeout, connect=min(timeout, 10.0)),
+        )
+        # Created on first use so they bind to the event loop that sends requests
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._rate_limit_lock: Optional[asyncio.Lock] = None
+        self._rate_limit_limit = 100
         self._rate_limit_remaining = 100
         self._rate_limit_reset = datetime.now().timestamp()
         self._current_method = None
@@ -121,7 +197,9 @@ class ClickUp:
 
     async def close(self):
         """Close the HTTP client and release resources."""
-        await self._client.aclose()
+        await self.time._cancel_running_refreshes()
+        if self._owns_http_client:
+            await self._client.aclose()
 
     def _get_headers(self) -> Dict[str, str]:
         """Get request headers including auth token."""
@@ -136,17 +214,43 @@ class ClickUp:
             "Authorization": self.api_token,
         }
 
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the semaphore capping concurrent in-flight requests."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    def _get_rate_limit_lock(self) -> asyncio.Lock:
+        """Get the lock serializing rate-limit budget checks."""
+        if self._rate_limit_lock is None:
+            self._rate_limit_lock = asyncio.Lock()
+        return self._rate_limit_lock
+
     async def _check_rate_limit(self):
-        """Handle rate limiting by waiting if needed."""
-        if self._rate_limit_remaining <= 5:
-            now = datetime.now().timestamp()
-            wait_time = max(0, self._rate_limit_reset - now + self.rate_limit_buffer)
-            if wait_time > 0:
-                logger.info(f"Rate limit approaching. Waiting {wait_time:.2f} seconds")
-                await asyncio.sleep(wait_time)
+        """Handle rate limiting by waiting if needed, then reserve one request.
+
+        Reserving under a lock keeps concurrent requests from all spending the
+        same remaining budget before any response has updated it.
+        """
+        async with self._get_rate_limit_lock():
+            if self._rate_limit_remaining <= 5:
+                now = datetime.now().timestamp()
+                wait_time = max(
+                    0, self._rate_limit_reset - now + self.rate_limit_buffer
+                )
+                if wait_time > 0:
+                    logger.info(
+                        f"Rate limit approaching. Waiting {wait_time:.2f} seconds"
+                    )
+                    await asyncio.sleep(wait_time)
+                # The window has reset; assume a full budget until headers disagree
+                self._rate_limit_remaining = self._rate_limit_limit
+            self._rate_limit_remaining -= 1
 
     def _update_rate_limit_info(self, response: httpx.Response):
         """Update rate limit information from response headers."""
+        if "X-RateLimit-Limit" in response.headers:
+            self._rate_limit_limit = int(response.headers["X-RateLimit-Limit"])
         if "X-RateLimit-Remaining" in response.headers:
             self._rate_limit_remaining = int(response.headers["X-RateLimit-Remaining"])
         if "X-RateLimit-Reset" in response.headers:
@@ -160,6 +264,7 @@ class ClickUp:
         data: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
         api_version: str = "v2",
+        json_body: Optional[bytes] = None,
     ) -> Dict[str, Any]:
         """
         Make a request to the ClickUp API with automatic retry and error handling.
@@ -171,10 +276,43 @@ class ClickUp:
             data: Request body data
             files: Files to upload
             api_version: API version to use (default: "v2")
+            json_body: Pre-encoded JSON request body, sent instead of data
 
         Returns:
             Response data as a dictionary or an empty dict for 204 responses
 
+        Raises:
+            RateLimitExceeded: When rate limit is exceeded and retries are exhausted
+            AuthenticationError: When authentication fails
+            ResourceNotFound: When the requested resource doesn't exist
+            ValidationError: When the request data is invalid
+            ClickUpError: For other API errors
+        """
+        response = await self._send(
+            method, endpoint, params, data, files, api_version, json_body=json_body
+        )
+        return self._parse_response(response)
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None,
+        api_version: str = "v2",
+        headers: Optional[Dict[str, str]] = None,
+        json_body: Optional[bytes] = None,
+    ) -> httpx.Response:
+        """
+        Send a request to the ClickUp API and return the raw HTTP response.
+
+        Takes the same arguments as _request, plus extra headers to send. A 304 Not
+        Modified answer to a conditional request is returned rather than raised.
+
+        Returns:
+            The successful httpx.Response
+
         Raises:
             RateLimitExceeded: When rate limit is exceeded and retries are exhausted
             AuthenticationError: When authentication fails
@@ -183,46 +321,60 @@ class ClickUp:
             ClickUpError: For other API errors
         """
         url = f"https://api.clickup.com/api/{api_version}/{endpoint.lstrip('/')}"
+        request_headers = self._get_headers()
+        if headers:
+            request_headers.update(headers)
+
+        # Encoded once, outside the retry loop
+        content = json_body
+        if content is None and data is not None and not files:
+            content = _encode_json(data)
 
         await self._check_rate_limit()
 
         retries = 0
         while True:
             try:
-                response = await self._client.request(
-                    method,
-                    url,
-                    headers=self._get_headers(),
-                    params=params,
-                    json=data if not files else None,
-                    files=files,
-                )
-                response.raise_for_status()
+                # Hold a slot only for the HTTP call so retry sleeps don't block others
+                async with self._get_semaphore():
+                    response = await self._client.request(
+                        method,
+                        url,
+                        headers=request_headers,
+                        params=params,
+                        content=content,
+                        files=files,
+                    )
+                if response.status_code != 304:
+                    response.raise_for_status()
                 self._update_rate_limit_info(response)
+                return response
 
-                # Handle 204 No Content responses
-                if response.status_code == 204 or not response.content.strip():
-                    return {}
-
-                try:
-                    return response.json()
-                except ValueError:
+            except httpx.HTTPStatusError as e:
+                status_code = e.response.status_code
+                if retries < self.max_retries and self._should_retry(
+                    method, status_code
+                ):
+                    self._update_rate_limit_info(e.response)
+                    wait = self._retry_wait(e.response, retries)
                     logger.warning(
-                        f"Expected JSON but received empty or invalid body for {method} {url}"
+                        f"Request got HTTP {status_code}. Retrying in {wait} seconds"
                     )
-                    return {}
+                    await asyncio.sleep(wait)
+                    retries += 1
+                    continue
 
-            except httpx.HTTPStatusError as e:
                 error_data = {}
                 try:
                     error_data = e.response.json()
                 except (ValueError, KeyError):
                     pass
 
-                status_code = e.response.status_code
                 err_msg = error_data.get("err", str(e))
 
-                if status_code == 401:
+                if status_code == 429:
+                    raise RateLimitExceeded(err_msg, status_code, error_data)
+                elif status_code == 401:
                     raise AuthenticationError(err_msg, status_code, error_data)
                 elif status_code == 404:
                     raise ResourceNotFound(err_msg, status_code, error_data)
@@ -235,7 +387,7 @@ class ClickUp:
 
             except (httpx.RequestError, asyncio.TimeoutError) as e:
                 if retries < self.max_retries:
-                    wait = self.retry_delay * (2**retries)  # Exponential backoff
+                    wait = self._backoff(retries)
                     logger.warning(
                         f"Request failed: {str(e)}. Retrying in {wait} seconds"
                     )
@@ -246,6 +398,46 @@ class ClickUp:
                     f"Request failed after {self.max_retries} retries: {str(e)}"
                 )
 
+    def _should_retry(self, method: str, status_code: int) -> bool:
+        """Whether an HTTP error status is transient and safe to retry."""
+        if status_code == 429:
+            # Rate-limited requests were not processed, so any method may be resent
+            return self.retry_rate_limited_requests
+        # A 5xx may come after a write was applied; only resend idempotent methods
+        return status_code >= 500 and method in _IDEMPOTENT_METHODS
+
+    def _retry_wait(self, response: httpx.Response, retries: int) -> float:
+        """Seconds to wait before retrying, honouring the API's rate-limit hints."""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass
+        if response.status_code == 429 and "X-RateLimit-Reset" in response.headers:
+            now = datetime.now().timestamp()
+            return max(0.0, self._rate_limit_reset - now + self.rate_limit_buffer)
+        return self._backoff(retries)
+
+    def _backoff(self, retries: int) -> float:
+        """Exponential backoff delay for a retry, capped at _MAX_BACKOFF seconds."""
+        return min(self.retry_delay * (2**retries), _MAX_BACKOFF)
+
+    def _parse_response(self, response: httpx.Response) -> Dict[str, Any]:
+        """Decode a response body, returning an empty dict when there is none."""
+        # Handle 204 No Content responses
+        if response.status_code == 204 or not response.content.strip():
+            return {}
+
+        try:
+            return _decode_json(response.content)
+        except ValueError:
+            logger.warning(
+                f"Expected JSON but received empty or invalid body for "
+                f"{response.request.method} {response.request.url}"
+            )
+            return {}
+
     # --- Static Method for OAuth --- #
 
     @staticmethod
@@ -19,7 +19,7 @@ from .tag import Tag
 from .task import BulkTimeInStatus, Task, TaskTimeInStatus, TimeInStatus
 from .time import TimeEntry
 from .user import Member, User
-from .view import View
+from .view import ListViewsResult, View
 from .webhook import Webhook
 from .workspace import (
     AuditLogApplicability,
@@ -32,6 +32,7 @@ from .workspace import (
     CustomItemAvatar,
     GetAuditLogsRequest,
     Workspace,
+    WorkspaceBundle,
 )
 
 __all__ = [
@@ -47,6 +48,7 @@ __all__ = [
     "CustomItem",
     "CustomItemAvatar",
     "Workspace",
+    "WorkspaceBundle",
     "AuditLogApplicability",
     "AuditLogEventStatus",
     "AuditLogPageDirection",
@@ -91,6 +93,7 @@ __all__ = [
     "DocPageListing",
     # View
     "View",
+    "ListViewsResult",
     # Webhook
     "Webhook",
     # Tag
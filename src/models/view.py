@@ -4,7 +4,7 @@ View models for ClickUp API.
 This module contains models related to views in ClickUp.
 """
 
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Any, Dict, List, Literal, NamedTuple, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -103,3 +103,10 @@ class View(BaseModel):
             }
         },
     )
+
+
+class ListViewsResult(NamedTuple):
+    """Views returned for a list, along with the view types it requires."""
+
+    views: List[View]
+    required_views: List[str]
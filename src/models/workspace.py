@@ -6,10 +6,12 @@ This module contains models related to workspaces (teams) in ClickUp.
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from .common import CustomField
+
 
 class Workspace(BaseModel):
     """A ClickUp workspace."""
@@ -120,3 +122,11 @@ class GetAuditLogsRequest(BaseModel):
 # Assuming AuditLogEntry is a dictionary for now as the response structure isn't fully defined
 # Define a more specific model if the response structure becomes clear.
 AuditLogEntry = Dict[str, Any]
+
+
+class WorkspaceBundle(NamedTuple):
+    """A workspace together with its custom task types and custom fields."""
+
+    workspace: Workspace
+    custom_task_types: List[CustomItem]
+    custom_fields: List[CustomField]
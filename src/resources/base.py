@@ -4,11 +4,49 @@ Base resource for ClickUp API.
 This module contains the base resource class that all other resources inherit from.
 """
 
-from typing import Any, Dict, Optional
+import asyncio
+import copy
+import re
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+M = TypeVar("M", bound=BaseModel)
+
+_MAX_AGE = re.compile(r"max-age=(\d+)")
+
+# Cache-Control directives that, without a max-age, mean "revalidate every time"
+_REVALIDATE_DIRECTIVES = frozenset({"no-cache", "private", "must-revalidate"})
+
+# (body, etag, expires_at) for a cached GET response
+_CacheEntry = Tuple[Dict[str, Any], Optional[str], float]
 
 
 class BaseResource:
-    """Base class for API resources."""
+    """Base class for API resources.
+
+    Resources hold no per-instance ``__dict__``; subclasses declare ``__slots__``
+    for any attributes they add.
+    """
+
+    __slots__ = ("client", "_inflight", "_response_cache", "_cache_generation")
+
+    # Resources whose GET responses may be reused for ClickUp.cache_ttl seconds
+    _cache_responses = False
 
     def __init__(self, client):
         """Initialize the resource with a client instance.
@@ -17,6 +55,9 @@ class BaseResource:
             client: The ClickUp client instance
         """
         self.client = client
+        self._inflight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self._response_cache: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        self._cache_generation = 0
 
     async def _request(
         self,
@@ -26,9 +67,17 @@ class BaseResource:
         data: Optional[Dict[str, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
         api_version: str = "v2",
+        json_body: Optional[bytes] = None,
+        cache: bool = True,
     ) -> Dict[str, Any]:
         """Delegate the request to the client's request method.
 
+        Concurrent identical GET requests made through the same resource share a
+        single HTTP call, and each caller gets its own copy of the response. Resources with ``_cache_responses`` set also
+        reuse GET responses until they expire, revalidating with ``If-None-Match``
+        when the API sent an ETag; any other request through them clears the cache.
+        Every caller of a cached GET gets its own copy of the response.
+
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
             endpoint: API endpoint path
@@ -36,18 +85,228 @@ class BaseResource:
             data: Request body data
             files: Files to upload
             api_version: API version to use
+            json_body: Pre-encoded JSON request body, sent instead of data
+            cache: Whether a GET may use the response cache; pass False for data
+                that other resources can change
 
         Returns:
             Response data as a dictionary or an empty dict for 204 responses
         """
+        if method == "GET":
+            key = (method, api_version, endpoint, self._params_key(params))
+            if self._cache_responses and cache:
+                body = await self._singleflight(
+                    key,
+                    lambda: self._cached_get(key, endpoint, params, api_version),
+                    copy_shared=False,
+                )
+                # The cached body is shared; callers may mutate what they get
+                return copy.deepcopy(body)
+            return await self._singleflight(
+                key,
+                lambda: self.client._request(
+                    method, endpoint, params, data, files, api_version
+                ),
+            )
+
+        self._clear_response_cache()
         response = await self.client._request(
-            method, endpoint, params, data, files, api_version
+            method, endpoint, params, data, files, api_version, json_body
         )
         # For 204 No Content responses, return an empty dict
         if not response and method == "DELETE":
             return {}
         return response
 
+    async def _request_raw(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        api_version: str = "v2",
+    ) -> bytes:
+        """Make a request and return the undecoded response body.
+
+        Lets callers hand the JSON bytes straight to a pydantic validator instead of
+        building an intermediate dict. Concurrent identical GET requests share a
+        single HTTP call, as with ``_request``.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint path
+            params: Query parameters
+            data: Request body data
+            api_version: API version to use
+
+        Returns:
+            The raw response body, empty for 204 responses
+        """
+
+        async def send() -> bytes:
+            response = await self.client._send(
+                method, endpoint, params, data, api_version=api_version
+            )
+            return response.content
+
+        if method == "GET":
+            key = ("raw", api_version, endpoint, self._params_key(params))
+            return await self._singleflight(key, send)
+
+        self._clear_response_cache()
+        return await send()
+
+    async def _cached_get(
+        self,
+        key: Hashable,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        api_version: str,
+    ) -> Dict[str, Any]:
+        """Serve a GET from the response cache, revalidating or refetching as needed."""
+        generation = self._cache_generation
+        entry = self._response_cache.get(key)
+        if entry is not None and time.monotonic() < entry[2]:
+            self._response_cache.move_to_end(key)
+            return entry[0]
+
+        headers = {"If-None-Match": entry[1]} if entry and entry[1] else None
+        response = await self.client._send(
+            "GET", endpoint, params, api_version=api_version, headers=headers
+        )
+        if response.status_code == 304 and entry is not None:
+            body = entry[0]
+        else:
+            body = self.client._parse_response(response)
+
+        cache_control = response.headers.get("Cache-Control", "").lower()
+        directives = {d.strip() for d in cache_control.split(",")}
+        max_age = _MAX_AGE.search(cache_control)
+        if max_age:
+            ttl = int(max_age.group(1))
+        elif directives & _REVALIDATE_DIRECTIVES:
+            # Usable only after revalidating, which needs an ETag
+            ttl = 0
+        else:
+            ttl = self.client.cache_ttl
+        if "no-cache" in directives:
+            ttl = 0
+        etag = response.headers.get("ETag")
+        if etag is None and response.status_code == 304 and entry is not None:
+            etag = entry[1]
+        if generation != self._cache_generation:
+            # A write went through this resource while the GET was in flight
+            return body
+        if "no-store" in directives or (ttl <= 0 and not etag):
+            self._response_cache.pop(key, None)
+            return body
+
+        self._response_cache[key] = (body, etag, time.monotonic() + ttl)
+        self._response_cache.move_to_end(key)
+        while len(self._response_cache) > self.client.cache_maxsize:
+            self._response_cache.popitem(last=False)
+        return body
+
+    def _clear_response_cache(self) -> None:
+        """Forget cached GET responses, including any still being fetched.
+
+        GETs already in flight still complete for their callers, but later GETs
+        no longer join them and start a fresh request instead.
+        """
+        self._response_cache.clear()
+        self._inflight.clear()
+        self._cache_generation += 1
+
+    async def _singleflight(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[T]],
+        copy_shared: bool = True,
+    ) -> T:
+        """Run ``factory`` once for all concurrent callers using the same key.
+
+        The first caller starts the work; callers arriving before it finishes await
+        the same result (or exception). Cancelling one caller does not cancel the
+        shared work for the others.
+
+        Args:
+            key: Hashable identifier of the operation
+            factory: Zero-argument callable returning the awaitable to share
+            copy_shared: Give callers that joined the work a deep copy of the result,
+                so no caller sees another's changes to it
+
+        Returns:
+            The result of the shared awaitable
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._forget_inflight(key, done))
+            return await asyncio.shield(future)
+        result = await asyncio.shield(future)
+        return copy.deepcopy(result) if copy_shared else result
+
+    def _forget_inflight(self, key: Hashable, future: "asyncio.Future[Any]") -> None:
+        """Remove a finished in-flight entry so failures are never reused."""
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.cancelled():
+            # Mark the exception as retrieved even if every caller went away
+            future.exception()
+
+    @staticmethod
+    def _params_key(params: Optional[Dict[str, Any]]) -> Tuple[Any, ...]:
+        """Build a hashable, order-independent key from query parameters."""
+        if not params:
+            return ()
+        return tuple(
+            sorted(
+                (k, tuple(v) if isinstance(v, list) else v) for k, v in params.items()
+            )
+        )
+
+    @staticmethod
+    def _custom_task_id_params(
+        custom_task_ids: bool, team_id: Optional[Union[str, int]]
+    ) -> Dict[str, str]:
+        """Build the query parameters for addressing a task by its custom ID.
+
+        Args:
+            custom_task_ids: Whether the task IDs in the request are custom task IDs
+            team_id: Workspace ID, required by the API when custom_task_ids is True
+
+        Returns:
+            The custom_task_ids/team_id parameters, or an empty dict
+
+        Raises:
+            ValueError: If custom_task_ids is True but team_id is not provided
+        """
+        if not custom_task_ids:
+            return {}
+        if not team_id:
+            raise ValueError("team_id is required when custom_task_ids is True.")
+        return {"custom_task_ids": "true", "team_id": str(team_id)}
+
+    def _build_model(self, model: Type[M], data: Dict[str, Any]) -> M:
+        """Build a model from response data.
+
+        The data is validated unless the client was created with
+        ``fast_construct=True`` (or ``CLICKUP_TRUST_API=1``), in which case it is
+        trusted as-is via ``model_construct``: nested objects stay plain dicts and
+        datetime fields keep the raw API values.
+
+        Args:
+            model: Pydantic model class to build
+            data: Response data for the model
+
+        Returns:
+            The model instance
+        """
+        if self.client.fast_construct:
+            return model.model_construct(**data)
+        return model.model_validate(data)
+
     def _get_context_id(
         self, id_name: str, provided_id: Optional[str] = None
     ) -> Optional[str]:
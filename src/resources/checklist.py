@@ -4,7 +4,7 @@ Checklist resources for ClickUp API.
 This module contains resource classes for interacting with checklist-related endpoints.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 from ..models import Checklist
 from .base import BaseResource
@@ -13,12 +13,14 @@ from .base import BaseResource
 class ChecklistResource(BaseResource):
     """Checklist-related API endpoints."""
 
+    __slots__ = ()
+
     async def create(
         self,
         name: str,
         task_id: Optional[str] = None,
         custom_task_ids: Optional[bool] = None,
-        team_id: Optional[int] = None,
+        team_id: Optional[Union[str, int]] = None,
     ) -> Checklist:
         """
         Create a checklist in a task.
@@ -33,8 +35,8 @@ class ChecklistResource(BaseResource):
             The created Checklist object
 
         Raises:
-            ValueError: If task_id is not provided and not set in context, or if
-                        custom_task_ids is true but team_id is missing.
+            ValueError: If task_id is not provided and not set in context
+            ValueError: If custom_task_ids is True but team_id is not provided
             AuthenticationError: If authentication fails
             ResourceNotFound: If the task doesn't exist
             ValidationError: If the request data is invalid
@@ -44,15 +46,8 @@ class ChecklistResource(BaseResource):
         if not task_id:
             raise ValueError("Task ID must be provided")
 
-        if custom_task_ids and team_id is None:
-            raise ValueError("team_id is required when custom_task_ids is true")
-
+        params = self._custom_task_id_params(bool(custom_task_ids), team_id)
         data = {"name": name}
-        params = {}
-        if custom_task_ids is not None:
-            params["custom_task_ids"] = str(custom_task_ids).lower()
-            if team_id is not None:
-                params["team_id"] = team_id
 
         response = await self._request(
             "POST", f"task/{task_id}/checklist", data=data, params=params
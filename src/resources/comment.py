@@ -13,6 +13,8 @@ from .base import BaseResource
 class CommentResource(BaseResource):
     """Comment-related API endpoints."""
 
+    __slots__ = ()
+
     async def get_task_comments(
         self,
         task_id: Optional[str] = None,
@@ -36,6 +38,7 @@ class CommentResource(BaseResource):
 
         Raises:
             ValueError: If task_id is not provided and not set in context
+            ValueError: If custom_task_ids is True but team_id is not provided
             AuthenticationError: If authentication fails
             ResourceNotFound: If the task doesn't exist
             ClickUpError: For other API errors
@@ -49,10 +52,7 @@ class CommentResource(BaseResource):
             params["start"] = str(start)
         if start_id is not None:
             params["start_id"] = start_id
-        if custom_task_ids:
-            params["custom_task_ids"] = str(custom_task_ids).lower()
-            if team_id:
-                params["team_id"] = team_id
+        params.update(self._custom_task_id_params(custom_task_ids, team_id))
 
         response = await self._request("GET", f"task/{task_id}/comment", params=params)
         return [
@@ -86,6 +86,7 @@ class CommentResource(BaseResource):
 
         Raises:
             ValueError: If task_id is not provided and not set in context
+            ValueError: If custom_task_ids is True but team_id is not provided
             AuthenticationError: If authentication fails
             ResourceNotFound: If the task doesn't exist
             ValidationError: If the request data is invalid
@@ -105,11 +106,7 @@ class CommentResource(BaseResource):
         if group_assignee:
             data["group_assignee"] = group_assignee
 
-        params = {}
-        if custom_task_ids:
-            params["custom_task_ids"] = str(custom_task_ids).lower()
-            if team_id:
-                params["team_id"] = team_id
+        params = self._custom_task_id_params(custom_task_ids, team_id)
 
         response = await self._request(
             "POST", f"task/{task_id}/comment", data=data, params=params
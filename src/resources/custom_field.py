@@ -13,6 +13,8 @@ from .base import BaseResource
 class CustomFieldResource(BaseResource):
     """Custom field-related API endpoints."""
 
+    __slots__ = ()
+
     async def get_workspace_fields(
         self,
         workspace_id: Optional[str] = None,
@@ -151,6 +153,7 @@ class CustomFieldResource(BaseResource):
 
         Raises:
             ValueError: If task_id is not provided and not set in context
+            ValueError: If custom_task_ids is True but team_id is not provided
             AuthenticationError: If authentication fails
             ResourceNotFound: If the task or field doesn't exist
             ValidationError: If the value is invalid for the field type
@@ -160,11 +163,7 @@ class CustomFieldResource(BaseResource):
         if not task_id:
             raise ValueError("Task ID must be provided")
 
-        params = {}
-        if custom_task_ids:
-            params["custom_task_ids"] = str(custom_task_ids).lower()
-            if team_id:
-                params["team_id"] = team_id
+        params = self._custom_task_id_params(custom_task_ids, team_id)
 
         data = {"value": value}
         return await self._request(
@@ -192,6 +191,7 @@ class CustomFieldResource(BaseResource):
 
         Raises:
             ValueError: If task_id is not provided and not set in context
+            ValueError: If custom_task_ids is True but team_id is not provided
             AuthenticationError: If authentication fails
             ResourceNotFound: If the task or field doesn't exist
             ClickUpError: For other API errors
@@ -200,11 +200,7 @@ class CustomFieldResource(BaseResource):
         if not task_id:
             raise ValueError("Task ID must be provided")
 
-        params = {}
-        if custom_task_ids:
-            params["custom_task_ids"] = str(custom_task_ids).lower()
-            if team_id:
-                params["team_id"] = team_id
+        params = self._custom_task_id_params(custom_task_ids, team_id)
 
         await self._request("DELETE", f"task/{task_id}/field/{field_id}", params=params)
         return True
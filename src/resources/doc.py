@@ -16,6 +16,8 @@ logger = logging.getLogger(__name__)
 class DocResource(BaseResource):
     """Doc-related API endpoints."""
 
+    __slots__ = ()
+
     async def get_all(
         self,
         workspace_id: Optional[str] = None,
@@ -13,6 +13,8 @@ from .base import BaseResource
 class FolderResource(BaseResource):
     """Folder-related API endpoints."""
 
+    __slots__ = ()
+
     async def get_all(self, space_id: Optional[str] = None) -> List[Folder]:
         """
         Get all folders in a space.
@@ -16,6 +16,8 @@ from .base import BaseResource
 class GoalResource(BaseResource):
     """Goal-related API endpoints."""
 
+    __slots__ = ()
+
     async def get_all(
         self,
         workspace_id: Optional[str] = None,
@@ -2,19 +2,18 @@
 Guest resources for ClickUp API.
 """
 
-import logging
 from typing import Any, Dict, Optional
 
 from ..exceptions import ClickUpError, ResourceNotFound, ValidationError
 from ..models.guest import Guest
 from .base import BaseResource
 
-logger = logging.getLogger("clickup")
-
 
 class GuestResource(BaseResource):
     """Guest-related API endpoints (Workspace level)."""
 
+    __slots__ = ()
+
     async def invite_guest_to_workspace(
         self,
         email: str,
@@ -15,6 +15,8 @@ from .base import BaseResource
 class ListResource(BaseResource):
     """List-related API endpoints."""
 
+    __slots__ = ()
+
     async def get_all(
         self,
         folder_id: Optional[str] = None,
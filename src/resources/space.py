@@ -13,6 +13,8 @@ from .base import BaseResource
 class SpaceResource(BaseResource):
     """Space-related API endpoints."""
 
+    __slots__ = ()
+
     async def get_spaces(
         self, workspace_id: Optional[str] = None, archived: bool = False
     ) -> List[Space]:
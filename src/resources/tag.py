@@ -4,19 +4,18 @@ Tag resources for ClickUp API.
 This module contains resource classes for interacting with tag-related endpoints.
 """
 
-import logging
 from typing import Any, Dict, List, Optional
 
 from ..exceptions import ResourceNotFound, ValidationError
 from ..models.tag import Tag
 from .base import BaseResource
 
-logger = logging.getLogger("clickup")
-
 
 class TagResource(BaseResource):
     """Tag-related API endpoints (primarily Space Tags)."""
 
+    __slots__ = ()
+
     async def get_space_tags(self, space_id: str) -> List[Tag]:
         """
         Get all tags for a specific Space.
@@ -20,6 +20,8 @@ from .base import BaseResource
 class TaskResource(BaseResource):
     """Task-related API endpoints."""
 
+    __slots__ = ()
+
     async def get_all(
         self,
         list_id: Optional[str] = None,
@@ -537,6 +539,7 @@ class TaskResource(BaseResource):
             ValueError: If task_id is not provided and not set in context
                       If neither file_path nor file_data is provided
                       If file_name is missing when using file_data
+                      If custom_task_ids is True but team_id is not provided
             AuthenticationError: If authentication fails
             ResourceNotFound: If the task doesn't exist
             ValidationError: If the request data is invalid
@@ -569,11 +572,7 @@ class TaskResource(BaseResource):
         url = f"{self.client.base_url.rstrip('/')}/task/{task_id}/attachment"
 
         # Set up query parameters
-        params = {}
-        if custom_task_ids:
-            params["custom_task_ids"] = str(custom_task_ids).lower()
-            if team_id:
-                params["team_id"] = team_id
+        params = self._custom_task_id_params(custom_task_ids, team_id)
 
         # Prepare the multipart form data
         files = {"attachment": (file_name, file_data or b"")}
@@ -630,12 +629,7 @@ class TaskResource(BaseResource):
                 "Exactly one of 'depends_on' or 'dependency_of' must be provided."
             )
 
-        params = {}
-        if custom_task_ids:
-            if not team_id:
-                raise ValueError("team_id is required when custom_task_ids is True.")
-            params["custom_task_ids"] = "true"
-            params["team_id"] = team_id
+        params = self._custom_task_id_params(custom_task_ids, team_id)
 
         data = {}
         if depends_on:
@@ -679,11 +673,7 @@ class TaskResource(BaseResource):
             "depends_on": depends_on,
             "dependency_of": dependency_of,
         }
-        if custom_task_ids:
-            if not team_id:
-                raise ValueError("team_id is required when custom_task_ids is True.")
-            params["custom_task_ids"] = "true"
-            params["team_id"] = team_id
+        params.update(self._custom_task_id_params(custom_task_ids, team_id))
 
         await self._request("DELETE", f"task/{task_id}/dependency", params=params)
         return True
@@ -713,12 +703,7 @@ class TaskResource(BaseResource):
             ResourceNotFound: If a task doesn't exist.
             ClickUpError: For other API errors.
         """
-        params = {}
-        if custom_task_ids:
-            if not team_id:
-                raise ValueError("team_id is required when custom_task_ids is True.")
-            params["custom_task_ids"] = "true"
-            params["team_id"] = team_id
+        params = self._custom_task_id_params(custom_task_ids, team_id)
 
         await self._request("POST", f"task/{task_id}/link/{links_to}", params=params)
         return True
@@ -748,12 +733,7 @@ class TaskResource(BaseResource):
             ResourceNotFound: If a task doesn't exist.
             ClickUpError: For other API errors.
         """
-        params = {}
-        if custom_task_ids:
-            if not team_id:
-                raise ValueError("team_id is required when custom_task_ids is True.")
-            params["custom_task_ids"] = "true"
-            params["team_id"] = team_id
+        params = self._custom_task_id_params(custom_task_ids, team_id)
 
         await self._request("DELETE", f"task/{task_id}/link/{links_to}", params=params)
         return True
@@ -784,12 +764,7 @@ class TaskResource(BaseResource):
             ResourceNotFound: If the task or tag doesn't exist.
             ClickUpError: For other API errors.
         """
-        params = {}
-        if custom_task_ids:
-            if not team_id:
-                raise ValueError("team_id is required when custom_task_ids is True.")
-            params["custom_task_ids"] = "true"
-            params["team_id"] = team_id
+        params = self._custom_task_id_params(custom_task_ids, team_id)
 
         await self._request("POST", f"task/{task_id}/tag/{tag_name}", params=params)
         # No return value
@@ -818,12 +793,7 @@ class TaskResource(BaseResource):
             ResourceNotFound: If the task or tag doesn't exist.
             ClickUpError: For other API errors.
         """
-        params = {}
-        if custom_task_ids:
-            if not team_id:
-                raise ValueError("team_id is required when custom_task_ids is True.")
-            params["custom_task_ids"] = "true"
-            params["team_id"] = team_id
+        params = self._custom_task_id_params(custom_task_ids, team_id)
 
         await self._request("DELETE", f"task/{task_id}/tag/{tag_name}", params=params)
         # No return value
@@ -861,11 +831,7 @@ class TaskResource(BaseResource):
             ClickUpError: For other API errors.
         """
         params = {"include_shared": str(include_shared).lower()}
-        if custom_task_ids:
-            if not team_id:
-                raise ValueError("team_id is required when custom_task_ids is True.")
-            params["custom_task_ids"] = "true"
-            params["team_id"] = team_id
+        params.update(self._custom_task_id_params(custom_task_ids, team_id))
 
         data = {"permission_level": permission_level}
 
@@ -900,11 +866,7 @@ class TaskResource(BaseResource):
             ClickUpError: For other API errors.
         """
         params = {"include_shared": str(include_shared).lower()}
-        if custom_task_ids:
-            if not team_id:
-                raise ValueError("team_id is required when custom_task_ids is True.")
-            params["custom_task_ids"] = "true"
-            params["team_id"] = team_id
+        params.update(self._custom_task_id_params(custom_task_ids, team_id))
 
         await self._request("DELETE", f"task/{task_id}/guest/{guest_id}", params=params)
         # No return value
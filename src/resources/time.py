@@ -4,10 +4,11 @@ Time tracking resources for ClickUp API.
 This module contains resource classes for interacting with time tracking-related endpoints.
 """
 
+import asyncio
 import json
 import logging
 import time
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from ..exceptions import ResourceNotFound, ValidationError
 from ..models import TimeEntry
@@ -19,6 +20,28 @@ logger = logging.getLogger("clickup")
 class TimeTrackingResource(BaseResource):
     """Time tracking-related API endpoints."""
 
+    __slots__ = ("_running_entries", "_running_refreshes", "_running_generation")
+
+    def __init__(self, client):
+        super().__init__(client)
+        self._running_entries: Dict[
+            Tuple[str, Optional[str]], Tuple[Optional[TimeEntry], float]
+        ] = {}
+        self._running_refreshes: Dict[Tuple[str, Optional[str]], asyncio.Task] = {}
+        self._running_generation = 0
+
+    def _invalidate_running_entry(self) -> None:
+        """Drop cached running entries and ignore refreshes already in flight."""
+        self._running_entries.clear()
+        self._running_generation += 1
+
+    async def _cancel_running_refreshes(self) -> None:
+        """Cancel background refreshes of running entries and wait for them."""
+        refreshes = list(self._running_refreshes.values())
+        for refresh in refreshes:
+            refresh.cancel()
+        await asyncio.gather(*refreshes, return_exceptions=True)
+
     async def start_timer(
         self,
         task_id: Optional[str] = None,
@@ -51,7 +74,7 @@ class TimeTrackingResource(BaseResource):
         if not workspace_id:
             raise ValueError("Workspace ID must be provided")
 
-        start = int(time.time() * 1000)  # Current time in milliseconds
+        start = time.time_ns() // 1_000_000  # Current time in milliseconds
         data = {
             "tid": task_id,
             "start": start,
@@ -67,8 +90,19 @@ class TimeTrackingResource(BaseResource):
         logger.debug(
             f"Time entry response: {json.dumps(response, indent=2) if isinstance(response, dict) else response}"
         )  # Debug log response content
-
-        return TimeEntry.model_validate(response.get("data", {}))
+        self._invalidate_running_entry()
+
+        # Fill in the fields we already know if the API leaves them out
+        return self._build_model(
+            TimeEntry,
+            {
+                "task_id": task_id,
+                "wid": workspace_id,
+                "start": start,
+                "duration": duration,
+                **response.get("data", {}),
+            },
+        )
 
     async def stop_timer(
         self,
@@ -94,6 +128,7 @@ class TimeTrackingResource(BaseResource):
             raise ValueError("Workspace ID must be provided")
 
         response = await self._request("POST", f"team/{workspace_id}/time_entries/stop")
+        self._invalidate_running_entry()
         return TimeEntry.model_validate(response.get("data", {}))
 
     async def get_entries(
@@ -133,6 +168,7 @@ class TimeTrackingResource(BaseResource):
 
         Raises:
             ValueError: If workspace_id is not provided and not set in context
+            ValueError: If custom_task_ids is True but team_id is not provided
             AuthenticationError: If authentication fails
             ResourceNotFound: If the workspace doesn't exist
             ClickUpError: For other API errors
@@ -141,18 +177,18 @@ class TimeTrackingResource(BaseResource):
         if not workspace_id:
             raise ValueError("Workspace ID must be provided")
 
-        params = {}
+        params: Dict[str, Any] = {}
 
         if start_date is not None:
-            params["start_date"] = str(start_date)
+            params["start_date"] = start_date
         if end_date is not None:
-            params["end_date"] = str(end_date)
+            params["end_date"] = end_date
         if assignee is not None:
             params["assignee"] = assignee
         if include_task_tags:
-            params["include_task_tags"] = str(include_task_tags).lower()
+            params["include_task_tags"] = "true"
         if include_location_names:
-            params["include_location_names"] = str(include_location_names).lower()
+            params["include_location_names"] = "true"
         if space_id:
             params["space_id"] = space_id
         if folder_id:
@@ -161,10 +197,7 @@ class TimeTrackingResource(BaseResource):
             params["list_id"] = list_id
         if task_id:
             params["task_id"] = task_id
-        if custom_task_ids:
-            params["custom_task_ids"] = str(custom_task_ids).lower()
-            if team_id:
-                params["team_id"] = team_id
+        params.update(self._custom_task_id_params(custom_task_ids, team_id))
 
         response = await self._request(
             "GET", f"team/{workspace_id}/time_entries", params=params
@@ -212,7 +245,7 @@ class TimeTrackingResource(BaseResource):
 
         # Default to current time if not provided
         if start is None:
-            start = int(time.time() * 1000)
+            start = time.time_ns() // 1_000_000
 
         data = {
             "description": description,
@@ -220,12 +253,11 @@ class TimeTrackingResource(BaseResource):
             "billable": billable,
         }
 
-        if task_id:
-            data["tid"] = task_id
-        if duration:
-            data["duration"] = duration
-        if tags:
-            data["tags"] = tags
+        data.update(
+            (key, value)
+            for key, value in (("tid", task_id), ("duration", duration), ("tags", tags))
+            if value
+        )
 
         response = await self._request(
             "POST", f"team/{workspace_id}/time_entries", data=data
@@ -275,24 +307,23 @@ class TimeTrackingResource(BaseResource):
         if not workspace_id:
             raise ValueError("Workspace ID must be provided")
 
-        data = {}
-
-        if description is not None:
-            data["description"] = description
-        if task_id is not None:
-            data["tid"] = task_id
-        if start is not None:
-            data["start"] = start
-        if duration is not None:
-            data["duration"] = duration
-        if billable is not None:
-            data["billable"] = billable
-        if tags is not None:
-            data["tags"] = tags
+        data = {
+            key: value
+            for key, value in (
+                ("description", description),
+                ("tid", task_id),
+                ("start", start),
+                ("duration", duration),
+                ("billable", billable),
+                ("tags", tags),
+            )
+            if value is not None
+        }
 
         response = await self._request(
             "PUT", f"team/{workspace_id}/time_entries/{time_entry_id}", data=data
         )
+        self._invalidate_running_entry()
 
         # Parse the response data
         data = response.get("data")
@@ -336,6 +367,7 @@ class TimeTrackingResource(BaseResource):
         await self._request(
             "DELETE", f"team/{workspace_id}/time_entries/{time_entry_id}"
         )
+        self._invalidate_running_entry()
         return True
 
     async def get_entry(
@@ -369,9 +401,9 @@ class TimeTrackingResource(BaseResource):
 
         params = {}
         if include_task_tags:
-            params["include_task_tags"] = str(include_task_tags).lower()
+            params["include_task_tags"] = "true"
         if include_location_names:
-            params["include_location_names"] = str(include_location_names).lower()
+            params["include_location_names"] = "true"
 
         response = await self._request(
             "GET", f"team/{workspace_id}/time_entries/{time_entry_id}", params=params
@@ -420,6 +452,13 @@ class TimeTrackingResource(BaseResource):
         """
         Get the currently running time entry for a user.
 
+        Results are cached per workspace and assignee. An entry younger than
+        ``ClickUp.running_entry_ttl`` is returned directly; one younger than
+        ``ClickUp.running_entry_max_age`` is returned while a refresh runs in the
+        background.
+        Starting, stopping, updating or deleting a timer through this resource clears
+        the cache.
+
         Args:
             workspace_id: ID of the workspace (uses the one set in the client context if not provided)
             assignee: User ID to check for running timer (defaults to authenticated user)
@@ -437,6 +476,41 @@ class TimeTrackingResource(BaseResource):
         if not workspace_id:
             raise ValueError("Workspace ID must be provided")
 
+        key = (workspace_id, assignee)
+        cached = self._running_entries.get(key)
+        if cached is not None:
+            entry, fetched_at = cached
+            age = time.monotonic() - fetched_at
+            if age < self.client.running_entry_ttl:
+                return entry
+            if age < self.client.running_entry_max_age:
+                if key not in self._running_refreshes:
+                    refresh = asyncio.ensure_future(
+                        self._fetch_running_entry(workspace_id, assignee)
+                    )
+                    self._running_refreshes[key] = refresh
+                    refresh.add_done_callback(
+                        lambda task: self._finish_running_refresh(key, task)
+                    )
+                return entry
+
+        return await self._fetch_running_entry(workspace_id, assignee)
+
+    def _finish_running_refresh(
+        self, key: Tuple[str, Optional[str]], task: asyncio.Task
+    ) -> None:
+        """Forget a finished background refresh and log its failure, if any."""
+        self._running_refreshes.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug(
+                f"Background refresh of running timer failed: {task.exception()}"
+            )
+
+    async def _fetch_running_entry(
+        self, workspace_id: str, assignee: Optional[str]
+    ) -> Optional[TimeEntry]:
+        """Fetch the running time entry from the API and cache the result."""
+        generation = self._running_generation
         params = {}
         if assignee:
             params["assignee"] = assignee
@@ -449,9 +523,10 @@ class TimeTrackingResource(BaseResource):
             # ClickUp API returns {"data":null} when no timer is running
             if data is None:
                 logger.debug("No running timer found (API returned null data).")
-                return None
-            # If data is present but invalid, model_validate will raise ValidationError
-            return TimeEntry.model_validate(data)
+                entry = None
+            else:
+                # If data is present but invalid, model_validate will raise ValidationError
+                entry = TimeEntry.model_validate(data)
         except ValidationError as e:
             # Log cases where data might be present but invalid
             logger.warning(
@@ -460,6 +535,11 @@ class TimeTrackingResource(BaseResource):
             return None
         # Let other ClickUpErrors propagate
 
+        # A timer started or stopped meanwhile makes this result stale
+        if generation == self._running_generation:
+            self._running_entries[(workspace_id, assignee)] = (entry, time.monotonic())
+        return entry
+
     async def remove_tags(
         self,
         time_entry_ids: List[str],
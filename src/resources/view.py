@@ -4,19 +4,57 @@ View resources for ClickUp API.
 This module contains resource classes for interacting with view-related endpoints.
 """
 
-import logging
-from typing import Any, Dict, List, Literal, Optional, Union
+import asyncio
+from itertools import chain
+from typing import Any, AsyncIterator, Dict, Iterable, List, Literal, Optional, Tuple
+
+from pydantic import TypeAdapter
 
 from ..exceptions import ResourceNotFound, ValidationError
-from ..models.view import View
+from ..models.view import ListViewsResult, View
 from .base import BaseResource
 
-logger = logging.getLogger("clickup")
+# Built once so list responses are validated in a single pydantic-core call
+_VIEW_LIST_ADAPTER = TypeAdapter(List[View])
+
+# View types accepted when creating or updating a view
+_VIEW_TYPES = frozenset(
+    {
+        "list",
+        "board",
+        "calendar",
+        "table",
+        "timeline",
+        "workload",
+        "activity",
+        "map",
+        "conversation",
+        "gantt",
+    }
+)
+
+# Optional view settings, also accepted by every create_*_view method
+_OPTIONAL_VIEW_FIELDS = (
+    "grouping",
+    "divide",
+    "sorting",
+    "filters",
+    "columns",
+    "team_sidebar",
+    "settings",
+)
+_UPDATABLE_VIEW_FIELDS = ("name", "type", "parent") + _OPTIONAL_VIEW_FIELDS
+# Returned by the API but never sent back when updating a view
+_READ_ONLY_VIEW_FIELDS = {"id", "url", "created", "user", "protected", "required"}
 
 
 class ViewResource(BaseResource):
     """View-related API endpoints."""
 
+    __slots__ = ()
+
+    _cache_responses = True
+
     async def get_workspace_views(
         self, workspace_id: Optional[str] = None
     ) -> List[View]:
@@ -43,7 +81,7 @@ class ViewResource(BaseResource):
 
         # API returns views in a list under the "views" key
         views_data = response.get("views", [])
-        return [View.model_validate(view) for view in views_data]
+        return _VIEW_LIST_ADAPTER.validate_python(views_data)
 
     async def create_workspace_view(
         self,
@@ -88,7 +126,8 @@ class ViewResource(BaseResource):
             The created View object
 
         Raises:
-            ValueError: If workspace_id is not provided and not set in context
+            ValueError: If workspace_id is not provided and not set in context,
+                or the view type is not supported
             AuthenticationError: If authentication fails
             ResourceNotFound: If the workspace doesn't exist
             ValidationError: If the request data is invalid
@@ -98,30 +137,18 @@ class ViewResource(BaseResource):
         if not workspace_id:
             raise ValueError("Workspace ID must be provided")
 
-        data: Dict[str, Any] = {
-            "name": name,
-            "type": type,
-        }
-
-        # Add optional parameters if provided
-        if grouping is not None:
-            data["grouping"] = grouping
-        if divide is not None:
-            data["divide"] = divide
-        if sorting is not None:
-            data["sorting"] = sorting
-        if filters is not None:
-            data["filters"] = filters
-        if columns is not None:
-            data["columns"] = columns
-        if team_sidebar is not None:
-            data["team_sidebar"] = team_sidebar
-        if settings is not None:
-            data["settings"] = settings
-
-        response = await self._request("POST", f"team/{workspace_id}/view", data=data)
-        # API returns the view object nested under a "view" key
-        return View.model_validate(response.get("view", {}))
+        return await self._create_view(
+            f"team/{workspace_id}/view",
+            name,
+            type,
+            grouping=grouping,
+            divide=divide,
+            sorting=sorting,
+            filters=filters,
+            columns=columns,
+            team_sidebar=team_sidebar,
+            settings=settings,
+        )
 
     async def get_space_views(self, space_id: str) -> List[View]:
         """
@@ -142,7 +169,7 @@ class ViewResource(BaseResource):
 
         # API returns views in a list under the "views" key
         views_data = response.get("views", [])
-        return [View.model_validate(view) for view in views_data]
+        return _VIEW_LIST_ADAPTER.validate_python(views_data)
 
     async def create_space_view(
         self,
@@ -187,35 +214,24 @@ class ViewResource(BaseResource):
             The created View object
 
         Raises:
+            ValueError: If the view type is not supported
             AuthenticationError: If authentication fails
             ResourceNotFound: If the space doesn't exist
             ValidationError: If the request data is invalid
             ClickUpError: For other API errors
         """
-        data: Dict[str, Any] = {
-            "name": name,
-            "type": type,
-        }
-
-        # Add optional parameters if provided
-        if grouping is not None:
-            data["grouping"] = grouping
-        if divide is not None:
-            data["divide"] = divide
-        if sorting is not None:
-            data["sorting"] = sorting
-        if filters is not None:
-            data["filters"] = filters
-        if columns is not None:
-            data["columns"] = columns
-        if team_sidebar is not None:
-            data["team_sidebar"] = team_sidebar
-        if settings is not None:
-            data["settings"] = settings
-
-        response = await self._request("POST", f"space/{space_id}/view", data=data)
-        # API returns the view object nested under a "view" key
-        return View.model_validate(response.get("view", {}))
+        return await self._create_view(
+            f"space/{space_id}/view",
+            name,
+            type,
+            grouping=grouping,
+            divide=divide,
+            sorting=sorting,
+            filters=filters,
+            columns=columns,
+            team_sidebar=team_sidebar,
+            settings=settings,
+        )
 
     async def get_folder_views(self, folder_id: str) -> List[View]:
         """
@@ -236,7 +252,7 @@ class ViewResource(BaseResource):
 
         # API returns views in a list under the "views" key
         views_data = response.get("views", [])
-        return [View.model_validate(view) for view in views_data]
+        return _VIEW_LIST_ADAPTER.validate_python(views_data)
 
     async def create_folder_view(
         self,
@@ -281,37 +297,26 @@ class ViewResource(BaseResource):
             The created View object
 
         Raises:
+            ValueError: If the view type is not supported
             AuthenticationError: If authentication fails
             ResourceNotFound: If the folder doesn't exist
             ValidationError: If the request data is invalid
             ClickUpError: For other API errors
         """
-        data: Dict[str, Any] = {
-            "name": name,
-            "type": type,
-        }
-
-        # Add optional parameters if provided
-        if grouping is not None:
-            data["grouping"] = grouping
-        if divide is not None:
-            data["divide"] = divide
-        if sorting is not None:
-            data["sorting"] = sorting
-        if filters is not None:
-            data["filters"] = filters
-        if columns is not None:
-            data["columns"] = columns
-        if team_sidebar is not None:
-            data["team_sidebar"] = team_sidebar
-        if settings is not None:
-            data["settings"] = settings
-
-        response = await self._request("POST", f"folder/{folder_id}/view", data=data)
-        # API returns the view object nested under a "view" key
-        return View.model_validate(response.get("view", {}))
+        return await self._create_view(
+            f"folder/{folder_id}/view",
+            name,
+            type,
+            grouping=grouping,
+            divide=divide,
+            sorting=sorting,
+            filters=filters,
+            columns=columns,
+            team_sidebar=team_sidebar,
+            settings=settings,
+        )
 
-    async def get_list_views(self, list_id: str) -> Dict[str, List[View]]:
+    async def get_list_views(self, list_id: str) -> ListViewsResult:
         """
         Get all views at the list level.
 
@@ -319,7 +324,7 @@ class ViewResource(BaseResource):
             list_id: ID of the list
 
         Returns:
-            Dictionary with "views" (List[View]) and "required_views" (List[str]) keys
+            ListViewsResult with the views and the required view types
 
         Raises:
             AuthenticationError: If authentication fails
@@ -327,18 +332,59 @@ class ViewResource(BaseResource):
             ClickUpError: For other API errors
         """
         response = await self._request("GET", f"list/{list_id}/view")
+        # Required views (if present) are returned as a list of view type strings
+        return ListViewsResult(
+            _VIEW_LIST_ADAPTER.validate_python(response.get("views", [])),
+            response.get("required_views", []),
+        )
 
-        result: Dict[str, List[View]] = {}
+    async def get_all_views(
+        self,
+        workspace_id: Optional[str] = None,
+        space_ids: Iterable[str] = (),
+        folder_ids: Iterable[str] = (),
+        list_ids: Iterable[str] = (),
+    ) -> List[View]:
+        """
+        Get workspace-level views plus those of the given spaces, folders and lists.
 
-        # Regular views
-        views_data = response.get("views", [])
-        result["views"] = [View.model_validate(view) for view in views_data]
+        The requests are sent concurrently, limited by the client's max_concurrency.
 
-        # Required views (if present) - API returns list of strings
-        required_views_data = response.get("required_views", [])
-        result["required_views"] = required_views_data  # Store as list of strings
+        Args:
+            workspace_id: ID of the workspace (uses the one set in the client context if not provided)
+            space_ids: IDs of the spaces to include
+            folder_ids: IDs of the folders to include
+            list_ids: IDs of the lists to include
 
-        return result
+        Returns:
+            List of View objects from every requested level
+
+        Raises:
+            ValueError: If workspace_id is not provided and not set in context
+            AuthenticationError: If authentication fails
+            ResourceNotFound: If any of the containers doesn't exist
+            ClickUpError: For other API errors
+        """
+        workspace_id = self._get_context_id("_workspace_id", workspace_id)
+        if not workspace_id:
+            raise ValueError("Workspace ID must be provided")
+
+        results = await asyncio.gather(
+            self.get_workspace_views(workspace_id),
+            *(self.get_space_views(space_id) for space_id in space_ids),
+            *(self.get_folder_views(folder_id) for folder_id in folder_ids),
+            *(self._get_list_view_objects(list_id) for list_id in list_ids),
+            return_exceptions=True,
+        )
+        # Let every request finish before surfacing the first failure
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return list(chain.from_iterable(results))
+
+    async def _get_list_view_objects(self, list_id: str) -> List[View]:
+        """Get only the View objects of a list's views."""
+        return (await self.get_list_views(list_id)).views
 
     async def create_list_view(
         self,
@@ -383,35 +429,49 @@ class ViewResource(BaseResource):
             The created View object
 
         Raises:
+            ValueError: If the view type is not supported
             AuthenticationError: If authentication fails
             ResourceNotFound: If the list doesn't exist
             ValidationError: If the request data is invalid
             ClickUpError: For other API errors
         """
-        data: Dict[str, Any] = {
-            "name": name,
-            "type": type,
-        }
+        return await self._create_view(
+            f"list/{list_id}/view",
+            name,
+            type,
+            grouping=grouping,
+            divide=divide,
+            sorting=sorting,
+            filters=filters,
+            columns=columns,
+            team_sidebar=team_sidebar,
+            settings=settings,
+        )
 
+    async def _create_view(
+        self, endpoint: str, name: str, type: str, **fields: Optional[Dict[str, Any]]
+    ) -> View:
+        """Create a view for one of the create_*_view methods.
+
+        Args:
+            endpoint: Endpoint of the view collection to create the view in
+            name: Name of the view
+            type: Type of view
+            **fields: Optional view settings, sent only when not None
+
+        Returns:
+            The created View object
+        """
+        if type not in _VIEW_TYPES:
+            raise ValueError(f"Invalid view type: {type}")
+
+        data: Dict[str, Any] = {"name": name, "type": type}
         # Add optional parameters if provided
-        if grouping is not None:
-            data["grouping"] = grouping
-        if divide is not None:
-            data["divide"] = divide
-        if sorting is not None:
-            data["sorting"] = sorting
-        if filters is not None:
-            data["filters"] = filters
-        if columns is not None:
-            data["columns"] = columns
-        if team_sidebar is not None:
-            data["team_sidebar"] = team_sidebar
-        if settings is not None:
-            data["settings"] = settings
-
-        response = await self._request("POST", f"list/{list_id}/view", data=data)
+        data.update({key: value for key, value in fields.items() if value is not None})
+
+        response = await self._request("POST", endpoint, data=data)
         # API returns the view object nested under a "view" key
-        return View.model_validate(response.get("view", {}))
+        return self._build_model(View, response.get("view", {}))
 
     async def get_view(self, view_id: str) -> View:
         """
@@ -484,55 +544,41 @@ class ViewResource(BaseResource):
             The updated View object
 
         Raises:
+            ValueError: If the view type is not supported
             AuthenticationError: If authentication fails
             ResourceNotFound: If the view doesn't exist
             ValidationError: If the request data is invalid
             ClickUpError: For other API errors
         """
-        # 1. Fetch the current view state
-        current_view = await self.get_view(view_id)
+        if type is not None and type not in _VIEW_TYPES:
+            raise ValueError(f"Invalid view type: {type}")
 
-        # 2. Convert current view to dict (ensure nested models are dicts)
-        # Use include to ensure all potentially required fields are present initially
+        args = locals()
+        update_payload: Dict[str, Any] = {
+            key: args[key] for key in _UPDATABLE_VIEW_FIELDS if args[key] is not None
+        }
+
+        if self.client.partial_updates and update_payload:
+            try:
+                response = await self._request(
+                    "PUT", f"view/{view_id}", data=update_payload
+                )
+                return View.model_validate(response.get("view", {}))
+            except ValidationError:
+                # The API wants the full view state; fall back to sending it
+                pass
+
+        # Fetch the current view state (served from the response cache when fresh)
+        current_view = await self.get_view(view_id)
+        # Every View field is already JSON-native, so skip the JSON-mode coercion
         data = current_view.model_dump(
-            mode="json", exclude_unset=False, exclude_none=False
+            exclude=_READ_ONLY_VIEW_FIELDS, exclude_none=True
         )
 
-        # Remove fields that should not be sent back or are read-only
-        data.pop("id", None)
-        data.pop("url", None)
-        data.pop("created", None)
-        data.pop("user", None)
-        data.pop("protected", None)
-        data.pop("required", None)
-
-        # 3. Merge provided updates into the data dict
-        update_payload: Dict[str, Any] = {}
-        if name is not None:
-            update_payload["name"] = name
-        if type is not None:
-            update_payload["type"] = type
-        if parent is not None:
-            update_payload["parent"] = parent
-        if grouping is not None:
-            update_payload["grouping"] = grouping
-        if divide is not None:
-            update_payload["divide"] = divide
-        if sorting is not None:
-            update_payload["sorting"] = sorting
-        if filters is not None:
-            update_payload["filters"] = filters
-        if columns is not None:
-            update_payload["columns"] = columns
-        if team_sidebar is not None:
-            update_payload["team_sidebar"] = team_sidebar
-        if settings is not None:
-            update_payload["settings"] = settings
-
         # Overwrite fetched data with user provided updates
         data.update(update_payload)
 
-        # 4. Send the complete data payload
+        # Send the complete data payload
         response = await self._request("PUT", f"view/{view_id}", data=data)
         # API returns the view object nested under a "view" key
         return View.model_validate(response.get("view", {}))
@@ -571,11 +617,61 @@ class ViewResource(BaseResource):
             ResourceNotFound: If the view doesn't exist
             ClickUpError: For other API errors
         """
+        tasks, _ = await self._get_view_tasks_page(view_id, page)
+        return tasks
+
+    async def _get_view_tasks_page(
+        self, view_id: str, page: int
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """Get one page of a view's tasks and whether it is the last page."""
+        # Not cached: tasks change through client.tasks, which can't invalidate it
         response = await self._request(
-            "GET", f"view/{view_id}/task", params={"page": page}
+            "GET", f"view/{view_id}/task", params={"page": page}, cache=False
         )
 
         # Return the tasks data
         # Note: We're returning the raw task dictionaries here since we don't know
         # which task model to use for validation (it depends on the view type)
-        return response.get("tasks", [])
+        tasks = response.get("tasks", [])
+        # An empty page ends the listing even if the API says more pages follow
+        return tasks, not tasks or bool(response.get("last_page", False))
+
+    async def iter_view_tasks(self, view_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over all visible tasks in a view, page by page.
+
+        Unless the API marks the current page as the last one, the next page is fetched
+        in the background while the current one is consumed.
+
+        Args:
+            view_id: ID of the view
+
+        Yields:
+            Task objects, as returned by get_view_tasks
+
+        Raises:
+            AuthenticationError: If authentication fails
+            ResourceNotFound: If the view doesn't exist
+            ClickUpError: For other API errors
+        """
+        page = 0
+        next_page: Optional[asyncio.Future] = asyncio.ensure_future(
+            self._get_view_tasks_page(view_id, page)
+        )
+        try:
+            while next_page is not None:
+                tasks, last_page = await next_page
+                next_page = None
+                if not last_page:
+                    page += 1
+                    next_page = asyncio.ensure_future(
+                        self._get_view_tasks_page(view_id, page)
+                    )
+                for task in tasks:
+                    yield task
+        finally:
+            # Don't leave a prefetch running if the caller stops early, and retrieve
+            # its outcome so a failed one isn't reported as never retrieved
+            if next_page is not None:
+                next_page.cancel()
+                await asyncio.gather(next_page, return_exceptions=True)
@@ -4,19 +4,26 @@ Webhook resources for ClickUp API.
 This module contains resource classes for interacting with webhook-related endpoints.
 """
 
-import logging
 from typing import Any, Dict, List, Optional
 
-from ..exceptions import ResourceNotFound, ValidationError
+from pydantic import TypeAdapter
+
 from ..models.webhook import Webhook
 from .base import BaseResource
 
-logger = logging.getLogger("clickup")
+# Built once so list responses are validated in a single pydantic-core call
+_WEBHOOK_LIST_ADAPTER = TypeAdapter(List[Webhook])
+
+_UPDATABLE_WEBHOOK_FIELDS = ("endpoint", "events", "status")
 
 
 class WebhookResource(BaseResource):
     """Webhook-related API endpoints."""
 
+    __slots__ = ()
+
+    _cache_responses = True
+
     async def get_webhooks(self, workspace_id: Optional[str] = None) -> List[Webhook]:
         """
         Get all webhooks for a workspace created by the authenticated user.
@@ -40,7 +47,7 @@ class WebhookResource(BaseResource):
         response = await self._request("GET", f"team/{workspace_id}/webhook")
         # API returns webhooks in a list under the "webhooks" key
         webhooks_data = response.get("webhooks", [])
-        return [Webhook.model_validate(hook) for hook in webhooks_data]
+        return _WEBHOOK_LIST_ADAPTER.validate_python(webhooks_data)
 
     async def create_webhook(
         self,
@@ -127,13 +134,10 @@ class WebhookResource(BaseResource):
             ValidationError: If the request data is invalid
             ClickUpError: For other API errors
         """
-        data: Dict[str, Any] = {}
-        if endpoint is not None:
-            data["endpoint"] = endpoint
-        if events is not None:
-            data["events"] = events
-        if status is not None:
-            data["status"] = status
+        args = locals()
+        data: Dict[str, Any] = {
+            key: args[key] for key in _UPDATABLE_WEBHOOK_FIELDS if args[key] is not None
+        }
 
         if not data:
             raise ValueError(
@@ -4,22 +4,61 @@ Workspace resources for ClickUp API.
 This module contains resource classes for interacting with workspace-related endpoints.
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
+from pydantic import TypeAdapter
+from typing_extensions import TypedDict
+
+from ..exceptions import ValidationError
 from ..models import (
     AuditLogEntry,
     AuditLogFilter,
     AuditLogPagination,
+    CustomField,
     CustomItem,
     GetAuditLogsRequest,
     Workspace,
+    WorkspaceBundle,
 )
 from .base import BaseResource
 
 
+# Response envelopes, validated straight from the JSON bytes by pydantic-core
+class _WorkspacesResponse(TypedDict, total=False):
+    teams: List[Workspace]
+
+
+class _WorkspaceResponse(TypedDict, total=False):
+    team: Workspace
+
+
+class _CustomItemsResponse(TypedDict, total=False):
+    custom_items: List[CustomItem]
+
+
+class _CustomFieldsResponse(TypedDict, total=False):
+    fields: List[CustomField]
+
+
+_WORKSPACES_ADAPTER = TypeAdapter(_WorkspacesResponse)
+_WORKSPACE_ADAPTER = TypeAdapter(_WorkspaceResponse)
+_CUSTOM_ITEMS_ADAPTER = TypeAdapter(_CustomItemsResponse)
+_CUSTOM_FIELDS_ADAPTER = TypeAdapter(_CustomFieldsResponse)
+
+
 class WorkspaceResource(BaseResource):
     """Workspace-related API endpoints."""
 
+    __slots__ = ("_metadata_cache", "_metadata_generation")
+
+    def __init__(self, client):
+        super().__init__(client)
+        # (kind, workspace_id) -> (expires_at, items) for custom task types/fields
+        self._metadata_cache: Dict[Tuple[str, str], Tuple[float, List[Any]]] = {}
+        self._metadata_generation = 0
+
     async def get_workspaces(self) -> List[Workspace]:
         """
         Get all workspaces accessible to the authenticated user.
@@ -27,8 +66,12 @@ class WorkspaceResource(BaseResource):
         Returns:
             List of Workspace objects
         """
-        response = await self._request("GET", "team")
-        return [Workspace.model_validate(team) for team in response.get("teams", [])]
+        if self.client.fast_construct:
+            response = await self._request("GET", "team")
+            return [self._build_model(Workspace, t) for t in response.get("teams", [])]
+
+        raw = await self._request_raw("GET", "team")
+        return _WORKSPACES_ADAPTER.validate_json(raw or b"{}").get("teams", [])
 
     async def get_workspace(self, workspace_id: Optional[str] = None) -> Workspace:
         """
@@ -42,13 +85,23 @@ class WorkspaceResource(BaseResource):
 
         Raises:
             ValueError: If workspace_id is not provided and not set in context
+            ValidationError: If the response has no workspace
         """
         workspace_id = self._get_context_id("_workspace_id", workspace_id)
         if not workspace_id:
             raise ValueError("Workspace ID must be provided")
 
-        response = await self._request("GET", f"team/{workspace_id}")
-        return Workspace.model_validate(response.get("team", {}))
+        if self.client.fast_construct:
+            response = await self._request("GET", f"team/{workspace_id}")
+            return self._build_model(Workspace, response.get("team", {}))
+
+        raw = await self._request_raw("GET", f"team/{workspace_id}")
+        team = _WORKSPACE_ADAPTER.validate_json(raw or b"{}").get("team")
+        if team is None:
+            raise ValidationError(
+                f"Unexpected response format for get_workspace: {raw!r}"
+            )
+        return team
 
     async def get_custom_task_types(
         self,
@@ -57,6 +110,9 @@ class WorkspaceResource(BaseResource):
         """
         Get all custom task types available in a workspace.
 
+        Results are reused for ClickUp.metadata_cache_ttl seconds; call
+        invalidate_custom_task_types to fetch them again sooner.
+
         Args:
             workspace_id: ID of the workspace (uses the one set in the client context if not provided)
 
@@ -73,19 +129,33 @@ class WorkspaceResource(BaseResource):
         if not workspace_id:
             raise ValueError("Workspace ID must be provided")
 
-        response = await self._request("GET", f"team/{workspace_id}/custom_item")
-        return [
-            CustomItem.model_validate(item) for item in response.get("custom_items", [])
-        ]
+        return await self._cached_metadata(
+            "custom_task_types", workspace_id, self._fetch_custom_task_types
+        )
+
+    async def _fetch_custom_task_types(self, workspace_id: str) -> List[CustomItem]:
+        """Fetch the custom task types of a workspace from the API."""
+        if self.client.fast_construct:
+            response = await self._request("GET", f"team/{workspace_id}/custom_item")
+            return [
+                self._build_model(CustomItem, item)
+                for item in response.get("custom_items", [])
+            ]
+
+        raw = await self._request_raw("GET", f"team/{workspace_id}/custom_item")
+        return _CUSTOM_ITEMS_ADAPTER.validate_json(raw or b"{}").get("custom_items", [])
 
     async def get_custom_fields(
         self,
         workspace_id: Optional[str] = None,
-    ) -> List:
+    ) -> List[CustomField]:
         """
         Get all custom fields available in a specific workspace.
         Note: This only returns custom fields created at the workspace level.
 
+        Results are reused for ClickUp.metadata_cache_ttl seconds; call
+        invalidate_custom_fields to fetch them again sooner.
+
         Args:
             workspace_id: ID of the workspace (uses the one set in the client context if not provided)
 
@@ -101,14 +171,106 @@ class WorkspaceResource(BaseResource):
         if not workspace_id:
             raise ValueError("Workspace ID must be provided")
 
-        response = await self._request("GET", f"team/{workspace_id}/field")
+        return await self._cached_metadata(
+            "custom_fields", workspace_id, self._fetch_custom_fields
+        )
+
+    async def _fetch_custom_fields(self, workspace_id: str) -> List[CustomField]:
+        """Fetch the workspace-level custom fields of a workspace from the API."""
+        if self.client.fast_construct:
+            response = await self._request("GET", f"team/{workspace_id}/field")
+            return [
+                self._build_model(CustomField, field)
+                for field in response.get("fields", [])
+            ]
+
+        raw = await self._request_raw("GET", f"team/{workspace_id}/field")
+        return _CUSTOM_FIELDS_ADAPTER.validate_json(raw or b"{}").get("fields", [])
+
+    async def _cached_metadata(
+        self,
+        kind: str,
+        workspace_id: str,
+        fetch: Callable[[str], Awaitable[List[Any]]],
+    ) -> List[Any]:
+        """Serve rarely changing workspace metadata from a short-lived cache.
+
+        Entries live for ``ClickUp.metadata_cache_ttl`` seconds. Concurrent misses
+        for the same entry share a single fetch.
+        """
+        key = (kind, workspace_id)
+        entry = self._metadata_cache.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            return list(entry[1])
+
+        async def load() -> List[Any]:
+            generation = self._metadata_generation
+            items = await fetch(workspace_id)
+            ttl = self.client.metadata_cache_ttl
+            # Don't store results fetched across an invalidation
+            if ttl > 0 and generation == self._metadata_generation:
+                self._metadata_cache[key] = (time.monotonic() + ttl, items)
+            return items
+
+        # Cache hits share the stored models too, so joiners need no deep copy
+        return list(
+            await self._singleflight(("metadata",) + key, load, copy_shared=False)
+        )
+
+    def _invalidate_metadata(self, kind: str, workspace_id: Optional[str]) -> None:
+        """Drop cached metadata of one kind for a workspace, or for all of them."""
+        for key in list(self._metadata_cache):
+            if key[0] == kind and workspace_id in (None, key[1]):
+                del self._metadata_cache[key]
+        self._metadata_generation += 1
 
-        # Import here to avoid circular imports
-        from ..models import CustomField
+    def invalidate_custom_task_types(self, workspace_id: Optional[str] = None) -> None:
+        """
+        Forget cached custom task types so the next call fetches them again.
+
+        Args:
+            workspace_id: ID of the workspace (all workspaces if not provided)
+        """
+        self._invalidate_metadata("custom_task_types", workspace_id)
 
-        return [
-            CustomField.model_validate(field) for field in response.get("fields", [])
-        ]
+    def invalidate_custom_fields(self, workspace_id: Optional[str] = None) -> None:
+        """
+        Forget cached workspace custom fields so the next call fetches them again.
+
+        Args:
+            workspace_id: ID of the workspace (all workspaces if not provided)
+        """
+        self._invalidate_metadata("custom_fields", workspace_id)
+
+    async def get_workspace_bundle(
+        self,
+        workspace_id: Optional[str] = None,
+    ) -> WorkspaceBundle:
+        """
+        Get a workspace, its custom task types and its custom fields concurrently.
+
+        Args:
+            workspace_id: ID of the workspace (uses the one set in the client context if not provided)
+
+        Returns:
+            WorkspaceBundle with the workspace, custom task types and custom fields
+
+        Raises:
+            ValueError: If workspace_id is not provided and not set in context
+            AuthenticationError: If authentication fails
+            ResourceNotFound: If the workspace doesn't exist
+            ClickUpError: For other API errors
+        """
+        workspace_id = self._get_context_id("_workspace_id", workspace_id)
+        if not workspace_id:
+            raise ValueError("Workspace ID must be provided")
+
+        workspace, custom_task_types, custom_fields = await asyncio.gather(
+            self.get_workspace(workspace_id),
+            self.get_custom_task_types(workspace_id),
+            self.get_custom_fields(workspace_id),
+        )
+        return WorkspaceBundle(workspace, custom_task_types, custom_fields)
 
     async def get_audit_logs(
         self,
@@ -150,7 +312,10 @@ class WorkspaceResource(BaseResource):
         response = await self._request(
             "POST",
             f"workspaces/{workspace_id}/auditlogs",
-            data=request_data.model_dump(by_alias=True, exclude_none=True),
+            # Serialized by pydantic-core directly, without a dict in between
+            json_body=request_data.model_dump_json(
+                by_alias=True, exclude_none=True
+            ).encode(),
         )
 
         # The response structure for audit logs isn't explicitly defined in the docs.
@@ -0,0 +1,38 @@
+"""
+Shared helpers for ClickUp API tests.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from src.exceptions import ResourceNotFound
+
+T = TypeVar("T")
+
+
+async def wait_for(
+    fetch: Callable[[], Awaitable[T]],
+    predicate: Callable[[Optional[T]], bool],
+    timeout: float = 10.0,
+    initial: float = 0.05,
+    factor: float = 2.0,
+    cap: float = 0.5,
+) -> Optional[T]:
+    """Call fetch until predicate accepts its result, for eventually consistent APIs.
+
+    ResourceNotFound counts as a result of None. Returns as soon as the predicate
+    holds, backing off between attempts, and returns the last result seen once the
+    timeout is spent so the test's own asserts report the failure.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = initial
+    while True:
+        try:
+            result: Optional[T] = await fetch()
+        except ResourceNotFound:
+            result = None
+        if predicate(result) or loop.time() + delay > deadline:
+            return result
+        await asyncio.sleep(delay)
+        delay = min(cap, delay * factor)
@@ -0,0 +1,253 @@
+"""
+Offline tests for the request sharing and response caching in BaseResource.
+
+These tests answer requests with httpx.MockTransport and need no API token.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.exceptions import ResourceNotFound
+
+pytestmark = pytest.mark.asyncio
+
+
+def view_body(name: str) -> dict:
+    return {"view": {"id": "v1", "name": name, "type": "list"}}
+
+
+async def test_write_detaches_inflight_get(mock_client):
+    """A GET issued after a write must not join a GET started before it."""
+    state = {"name": "old"}
+    release = asyncio.Event()
+    gets = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal gets
+        if request.method == "GET":
+            gets += 1
+            name = state["name"]
+            if gets == 1:
+                await release.wait()
+            return httpx.Response(200, json=view_body(name))
+        state["name"] = "new"
+        return httpx.Response(200, json=view_body("new"))
+
+    client = mock_client(handler, partial_updates=True)
+    first = asyncio.ensure_future(client.views.get_view("v1"))
+    await asyncio.sleep(0.01)  # First GET is now waiting in the handler
+
+    await client.views.update_view("v1", name="new")
+    try:
+        # Without the fix this joins the first GET, which only finishes below
+        after_write = await asyncio.wait_for(client.views.get_view("v1"), 1)
+    finally:
+        release.set()
+
+    assert after_write.name == "new"
+    assert (await first).name == "old"
+    assert gets == 2
+
+
+def counting_handler(headers=None, status=200):
+    """Answer GET view/v1 with a fixed view, recording every request seen."""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.method != "GET":
+            return httpx.Response(200, json=view_body("updated"))
+        return httpx.Response(status, json=view_body("cached"), headers=headers)
+
+    return handler, seen
+
+
+async def test_cache_hit_within_ttl(mock_client):
+    """A repeated GET within the TTL is served from the cache."""
+    handler, seen = counting_handler()
+    client = mock_client(handler, cache_ttl=60)
+
+    first = await client.views.get_view("v1")
+    second = await client.views.get_view("v1")
+
+    assert first.name == second.name == "cached"
+    assert len(seen) == 1
+
+
+async def test_cache_revalidates_with_etag(mock_client):
+    """An expired entry with an ETag is revalidated and reused on 304."""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.headers.get("If-None-Match") == '"v1-etag"':
+            return httpx.Response(304, headers={"ETag": '"v1-etag"'})
+        return httpx.Response(
+            200,
+            json=view_body("cached"),
+            headers={"ETag": '"v1-etag"', "Cache-Control": "no-cache"},
+        )
+
+    client = mock_client(handler, cache_ttl=60)
+
+    first = await client.views.get_view("v1")
+    second = await client.views.get_view("v1")
+
+    assert first.name == second.name == "cached"
+    assert len(seen) == 2
+    assert "If-None-Match" not in seen[0].headers
+    assert seen[1].headers["If-None-Match"] == '"v1-etag"'
+
+
+@pytest.mark.parametrize("cache_control", ["no-store", "no-cache", "private"])
+async def test_cache_control_disables_reuse(mock_client, cache_control):
+    """no-store, and no-cache/private without an ETag, are never served cached."""
+    handler, seen = counting_handler(headers={"Cache-Control": cache_control})
+    client = mock_client(handler, cache_ttl=60)
+
+    await client.views.get_view("v1")
+    await client.views.get_view("v1")
+
+    assert len(seen) == 2
+    assert all("If-None-Match" not in request.headers for request in seen)
+
+
+async def test_cache_evicts_least_recently_used(mock_client):
+    """The cache keeps at most cache_maxsize entries, dropping the oldest."""
+    handler, seen = counting_handler()
+    client = mock_client(handler, cache_ttl=60, cache_maxsize=2)
+
+    for view_id in ("a", "b", "c"):
+        await client.views.get_view(view_id)
+    await client.views.get_view("b")  # Still cached
+    await client.views.get_view("a")  # Evicted by "c"
+
+    assert [request.url.path.rsplit("/", 1)[-1] for request in seen] == [
+        "a",
+        "b",
+        "c",
+        "a",
+    ]
+
+
+async def test_cache_cleared_by_write(mock_client):
+    """Any non-GET request through the resource invalidates its cache."""
+    handler, seen = counting_handler()
+    client = mock_client(handler, cache_ttl=60)
+
+    await client.views.get_view("v1")
+    await client.views.delete_view("v1")
+    await client.views.get_view("v1")
+
+    assert [request.method for request in seen] == ["GET", "DELETE", "GET"]
+
+
+async def test_cache_hits_return_copies(mock_client):
+    """Mutating a cached response does not change what later callers get."""
+    handler, _ = counting_handler()
+    client = mock_client(handler, cache_ttl=60)
+
+    first = await client.views._request("GET", "view/v1")
+    first["view"]["name"] = "mutated"
+    second = await client.views._request("GET", "view/v1")
+
+    assert second["view"]["name"] == "cached"
+
+
+async def test_view_tasks_are_not_cached(mock_client):
+    """View task listings always hit the API; task writes cannot invalidate them."""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"tasks": [{"id": "t1"}]})
+
+    client = mock_client(handler, cache_ttl=60)
+
+    await client.views.get_view_tasks("v1")
+    await client.views.get_view_tasks("v1")
+
+    assert len(seen) == 2
+
+
+def gated_handler(status=200):
+    """Hold every request until the returned event is set, recording each one."""
+    release = asyncio.Event()
+    seen = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        await release.wait()
+        return httpx.Response(status, json={"id": "t1"})
+
+    return handler, release, seen
+
+
+async def test_singleflight_shares_concurrent_gets(mock_client):
+    """Concurrent identical GETs through one resource make a single request."""
+    handler, release, seen = gated_handler()
+    client = mock_client(handler)
+
+    waiters = [
+        asyncio.ensure_future(client.tasks._request("GET", "task/t1")) for _ in range(3)
+    ]
+    await asyncio.sleep(0.01)
+    release.set()
+    results = await asyncio.gather(*waiters)
+
+    assert results == [{"id": "t1"}] * 3
+    assert len(seen) == 1
+
+
+async def test_singleflight_gives_each_waiter_its_own_response(mock_client):
+    """Mutating a shared GET response does not change what other waiters see."""
+    handler, release, seen = gated_handler()
+    client = mock_client(handler)
+
+    waiters = [
+        asyncio.ensure_future(client.tasks._request("GET", "task/t1")) for _ in range(2)
+    ]
+    await asyncio.sleep(0.01)
+    release.set()
+    first, second = await asyncio.gather(*waiters)
+    first["id"] = "mutated"
+
+    assert second == {"id": "t1"}
+    assert len(seen) == 1
+
+
+async def test_singleflight_shares_but_forgets_failures(mock_client):
+    """A failure reaches every waiter, and the next GET makes a new request."""
+    handler, release, seen = gated_handler(status=404)
+    client = mock_client(handler)
+
+    waiters = [
+        asyncio.ensure_future(client.tasks._request("GET", "task/t1")) for _ in range(2)
+    ]
+    await asyncio.sleep(0.01)
+    release.set()
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+
+    assert all(isinstance(result, ResourceNotFound) for result in results)
+    assert len(seen) == 1
+    with pytest.raises(ResourceNotFound):
+        await client.tasks._request("GET", "task/t1")
+    assert len(seen) == 2
+
+
+async def test_singleflight_survives_cancelled_waiter(mock_client):
+    """Cancelling one waiter does not cancel the shared request for the others."""
+    handler, release, seen = gated_handler()
+    client = mock_client(handler)
+
+    cancelled = asyncio.ensure_future(client.tasks._request("GET", "task/t1"))
+    remaining = asyncio.ensure_future(client.tasks._request("GET", "task/t1"))
+    await asyncio.sleep(0.01)
+    cancelled.cancel()
+    release.set()
+
+    assert await remaining == {"id": "t1"}
+    assert cancelled.cancelled()
+    assert len(seen) == 1
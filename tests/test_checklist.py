@@ -10,7 +10,7 @@ To run these tests, you need to set up the following environment variables:
 
 import asyncio
 import logging
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Awaitable, Callable, Dict, Iterable, Optional
 from uuid import uuid4
 
 import pytest
@@ -20,15 +20,39 @@ from pydantic_core import ValidationError as PydanticValidationError
 from src import Checklist, ClickUp
 from src.exceptions import ClickUpError, ResourceNotFound, ValidationError
 from src.models.checklist import ChecklistItem  # Import directly from models module
+from tests.helpers import wait_for
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger("clickup")
 
 # Mark all tests in this module as asyncio
 pytestmark = pytest.mark.asyncio
 
 
+def _by_id(items: Iterable[ChecklistItem]) -> Dict[str, ChecklistItem]:
+    """Index checklist items by ID."""
+    return {item.id: item for item in items}
+
+
+def _by_name(items: Iterable[ChecklistItem]) -> Dict[str, ChecklistItem]:
+    """Index checklist items by name."""
+    return {item.name: item for item in items}
+
+
+def _item_after(
+    update: Callable[[], Awaitable[Checklist]], item_id: str
+) -> Callable[[], Awaitable[Optional[ChecklistItem]]]:
+    """Fetch an item by re-applying an idempotent update to its checklist."""
+
+    async def fetch() -> Optional[ChecklistItem]:
+        return _by_id((await update()).items).get(item_id)
+
+    return fetch
+
+
+# Checklist item updates can take several seconds to show up
+ITEM_BACKOFF = dict(timeout=20.0, initial=0.5, factor=1.5, cap=5.0)
+
+
 @pytest_asyncio.fixture
 async def sample_checklist(
     client: ClickUp, test_task
@@ -61,9 +85,7 @@ async def sample_checklist_item(
     updated_checklist = await client.checklists.create_item(
         checklist_id=sample_checklist.id, name=item_name
     )
-    created_item = next(
-        (item for item in updated_checklist.items if item.name == item_name), None
-    )
+    created_item = _by_name(updated_checklist.items).get(item_name)
     assert created_item is not None, "Failed to find created item in checklist"
     assert isinstance(created_item, ChecklistItem)
     yield created_item
@@ -93,7 +115,7 @@ async def test_create_checklist(client: ClickUp, test_task):
 async def test_create_checklist_with_custom_id_fail(client: ClickUp, test_task):
     """Test creating a checklist with custom ID without team_id fails."""
     with pytest.raises(
-        ValueError, match="team_id is required when custom_task_ids is true"
+        ValueError, match="team_id is required when custom_task_ids is True"
     ):
         await client.checklists.create(
             task_id=test_task.id, name="test_fail", custom_task_ids=True
@@ -112,9 +134,6 @@ async def test_update_checklist(client: ClickUp, sample_checklist: Checklist):
     assert updated_checklist.name == new_name
     assert updated_checklist.id == sample_checklist.id
 
-    # Wait briefly before position update
-    await asyncio.sleep(1)
-
     # Update position to 0 (top) - Position updates can be inconsistent
     updated_checklist_pos = await client.checklists.update(
         checklist_id=sample_checklist.id, position=0
@@ -122,9 +141,6 @@ async def test_update_checklist(client: ClickUp, sample_checklist: Checklist):
     assert updated_checklist_pos is not None  # Check call succeeded
     # NOTE: orderindex assertions removed due to API inconsistency
 
-    # Wait briefly before final update
-    await asyncio.sleep(1)
-
     final_name = f"final_name_{uuid4()}"
     final_checklist = await client.checklists.update(
         checklist_id=sample_checklist.id,
@@ -182,9 +198,7 @@ async def test_create_checklist_item(client: ClickUp, sample_checklist: Checklis
     updated_checklist = await client.checklists.create_item(
         checklist_id=sample_checklist.id, name=item_name, assignee=assignee_user_id
     )
-    created_item = next(
-        (item for item in updated_checklist.items if item.name == item_name), None
-    )
+    created_item = _by_name(updated_checklist.items).get(item_name)
 
     assert created_item is not None
     assert created_item.name == item_name
@@ -203,81 +217,68 @@ async def test_update_checklist_item(
         f"Starting test_update_checklist_item for item {sample_checklist_item.id} in checklist {sample_checklist.id}"
     )
     new_item_name = f"updated_item_{uuid4()}"
-    updated_checklist = await client.checklists.update_item(
-        checklist_id=sample_checklist.id,
-        item_id=sample_checklist_item.id,
-        name=new_item_name,
-    )
-    updated_item = next(
-        (
-            item
-            for item in updated_checklist.items
-            if item.id == sample_checklist_item.id
+    updated_item = await wait_for(
+        _item_after(
+            lambda: client.checklists.update_item(
+                checklist_id=sample_checklist.id,
+                item_id=sample_checklist_item.id,
+                name=new_item_name,
+            ),
+            sample_checklist_item.id,
         ),
-        None,
+        lambda item: item is not None and item.name == new_item_name,
+        **ITEM_BACKOFF,
     )
     assert updated_item and updated_item.name == new_item_name
     logger.debug(f"Item {sample_checklist_item.id} name updated successfully")
 
-    # Wait briefly between operations
-    await asyncio.sleep(5)
-
     # Test resolving/unresolving
-    updated_checklist_res = await client.checklists.update_item(
-        checklist_id=sample_checklist.id,
-        item_id=sample_checklist_item.id,
-        resolved=True,
-    )
-    resolved_item = next(
-        (
-            item
-            for item in updated_checklist_res.items
-            if item.id == sample_checklist_item.id
+    resolved_item = await wait_for(
+        _item_after(
+            lambda: client.checklists.update_item(
+                checklist_id=sample_checklist.id,
+                item_id=sample_checklist_item.id,
+                resolved=True,
+            ),
+            sample_checklist_item.id,
         ),
-        None,
+        lambda item: item is not None and item.resolved is True,
+        **ITEM_BACKOFF,
     )
     assert resolved_item and resolved_item.resolved is True
     logger.debug(f"Item {sample_checklist_item.id} resolved successfully")
 
-    await asyncio.sleep(5)
-
-    updated_checklist_unres = await client.checklists.update_item(
-        checklist_id=sample_checklist.id,
-        item_id=sample_checklist_item.id,
-        resolved=False,
-    )
-    unresolved_item = next(
-        (
-            item
-            for item in updated_checklist_unres.items
-            if item.id == sample_checklist_item.id
+    unresolved_item = await wait_for(
+        _item_after(
+            lambda: client.checklists.update_item(
+                checklist_id=sample_checklist.id,
+                item_id=sample_checklist_item.id,
+                resolved=False,
+            ),
+            sample_checklist_item.id,
         ),
-        None,
+        lambda item: item is not None and item.resolved is False,
+        **ITEM_BACKOFF,
     )
     assert unresolved_item and unresolved_item.resolved is False
     logger.debug(f"Item {sample_checklist_item.id} unresolved successfully")
 
-    await asyncio.sleep(5)
-
     # Test assigning/unassigning
-    updated_checklist_unassign = await client.checklists.update_item(
-        checklist_id=sample_checklist.id,
-        item_id=sample_checklist_item.id,
-        assignee=None,  # Unassign
-    )
-    unassigned_item = next(
-        (
-            item
-            for item in updated_checklist_unassign.items
-            if item.id == sample_checklist_item.id
+    unassigned_item = await wait_for(
+        _item_after(
+            lambda: client.checklists.update_item(
+                checklist_id=sample_checklist.id,
+                item_id=sample_checklist_item.id,
+                assignee=None,  # Unassign
+            ),
+            sample_checklist_item.id,
         ),
-        None,
+        lambda item: item is not None and item.assignee is None,
+        **ITEM_BACKOFF,
     )
     assert unassigned_item and unassigned_item.assignee is None
     logger.debug(f"Item {sample_checklist_item.id} unassigned successfully")
 
-    await asyncio.sleep(5)
-
     # --- Test nesting --- (REMOVED due to API inconsistency)
 
     # --- Test un-nesting --- (REMOVED due to API inconsistency)
@@ -292,10 +293,7 @@ async def test_delete_checklist_item(client: ClickUp, sample_checklist: Checklis
     updated_checklist = await client.checklists.create_item(
         checklist_id=sample_checklist.id, name=item_name
     )
-    item_to_delete = next(
-        (item for item in updated_checklist.items if item.name == item_name),
-        None,
-    )
+    item_to_delete = _by_name(updated_checklist.items).get(item_name)
     assert (
         item_to_delete is not None
     ), f"Could not create item '{item_name}' for deletion test"
@@ -0,0 +1,166 @@
+"""
+Offline tests for the ClickUp client's request handling.
+
+These tests answer requests with httpx.MockTransport and need no API token.
+"""
+
+import asyncio
+from datetime import datetime
+
+import httpx
+import pytest
+
+from src import ClickUp
+from src.exceptions import ClickUpError, RateLimitExceeded
+from src.resources.base import BaseResource
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_rate_limit_budget_reserved_across_concurrent_calls(mock_client):
+    """Concurrent requests share the remaining budget instead of all spending it."""
+    loop = asyncio.get_running_loop()
+    started = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        started.append(loop.time())
+        return httpx.Response(200, json={})
+
+    client = mock_client(handler, rate_limit_buffer=0)
+    # Three requests left before the client holds back, until the window resets
+    client._rate_limit_remaining = 8
+    client._rate_limit_reset = datetime.now().timestamp() + 0.3
+    begin = loop.time()
+
+    await asyncio.gather(
+        *(client.tasks._request("GET", f"task/t{i}") for i in range(5))
+    )
+
+    offsets = sorted(t - begin for t in started)
+    assert all(offset < 0.2 for offset in offsets[:3])
+    assert all(offset >= 0.25 for offset in offsets[3:])
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record the client's sleeps and skip them."""
+    recorded = []
+
+    async def fake_sleep(delay, *args, **kwargs):
+        recorded.append(delay)
+
+    monkeypatch.setattr("src.client.asyncio.sleep", fake_sleep)
+    return recorded
+
+
+def scripted_handler(*responses):
+    """Answer requests with the given responses in turn, recording each request."""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return responses[min(len(seen), len(responses)) - 1]
+
+    return handler, seen
+
+
+async def test_retry_honours_retry_after(mock_client, sleeps):
+    """A 429 with Retry-After is retried after exactly that many seconds."""
+    handler, seen = scripted_handler(
+        httpx.Response(429, headers={"Retry-After": "7"}),
+        httpx.Response(200, json={"ok": True}),
+    )
+    client = mock_client(handler)
+
+    assert await client._request("GET", "task/t1") == {"ok": True}
+    assert len(seen) == 2
+    assert sleeps == [7.0]
+
+
+async def test_retry_waits_for_rate_limit_reset(mock_client, sleeps):
+    """A 429 without Retry-After waits until X-RateLimit-Reset plus the buffer."""
+    reset = datetime.now().timestamp() + 12
+    handler, seen = scripted_handler(
+        httpx.Response(429, headers={"X-RateLimit-Reset": str(reset)}),
+        httpx.Response(200, json={}),
+    )
+    client = mock_client(handler, rate_limit_buffer=5)
+
+    await client._request("GET", "task/t1")
+
+    assert len(seen) == 2
+    assert len(sleeps) == 1 and 16 < sleeps[0] <= 17
+
+
+@pytest.mark.parametrize("method", ["GET", "PUT", "DELETE"])
+async def test_retry_5xx_for_idempotent_methods(mock_client, sleeps, method):
+    """Server errors are retried for methods that are safe to resend."""
+    handler, seen = scripted_handler(
+        httpx.Response(503), httpx.Response(200, json={"ok": True})
+    )
+    client = mock_client(handler)
+
+    assert await client._request(method, "task/t1") == {"ok": True}
+    assert len(seen) == 2
+
+
+async def test_no_retry_5xx_for_post(mock_client, sleeps):
+    """A POST that failed with a server error may have been applied; no resend."""
+    handler, seen = scripted_handler(
+        httpx.Response(503), httpx.Response(200, json={"ok": True})
+    )
+    client = mock_client(handler)
+
+    with pytest.raises(ClickUpError) as excinfo:
+        await client._request("POST", "list/l1/task", data={"name": "t"})
+    assert excinfo.value.status_code == 503
+    assert len(seen) == 1
+    assert sleeps == []
+
+
+async def test_rate_limit_exceeded_after_max_retries(mock_client, sleeps):
+    """RateLimitExceeded is raised once every retry has been spent on 429s."""
+    handler, seen = scripted_handler(httpx.Response(429, headers={"Retry-After": "1"}))
+    client = mock_client(handler, max_retries=2)
+
+    with pytest.raises(RateLimitExceeded):
+        await client._request("GET", "task/t1")
+    assert len(seen) == 3
+    assert sleeps == [1.0, 1.0]
+
+
+async def test_retry_backoff_capped(mock_client, sleeps):
+    """Exponential backoff between retries never exceeds 30 seconds."""
+    handler, seen = scripted_handler(
+        httpx.Response(503),
+        httpx.Response(503),
+        httpx.Response(503),
+        httpx.Response(200, json={}),
+    )
+    client = mock_client(handler, retry_delay=10.0, max_retries=3)
+
+    await client._request("GET", "task/t1")
+
+    assert len(seen) == 4
+    assert sleeps == [10.0, 20.0, 30.0]
+
+
+@pytest.mark.parametrize("timeout, connect", [(3.0, 3.0), (30.0, 10.0)])
+async def test_connect_timeout_never_exceeds_timeout(timeout, connect):
+    """The connect timeout is 10s at most, and never longer than timeout."""
+    async with ClickUp("dummy", timeout=timeout) as client:
+        assert client._client.timeout.connect == connect
+        assert client._client.timeout.read == timeout
+
+
+async def test_resources_use_slots():
+    """Resource managers carry no per-instance __dict__, so can't be patched."""
+    async with ClickUp("dummy") as client:
+        resources = [
+            value for value in vars(client).values() if isinstance(value, BaseResource)
+        ]
+        assert resources
+        for resource in resources:
+            assert not hasattr(resource, "__dict__"), type(resource).__name__
+        with pytest.raises(AttributeError):
+            client.views.get_view_tasks = None
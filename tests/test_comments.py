@@ -3,7 +3,7 @@ Tests for ClickUp comment operations.
 """
 
 import asyncio
-from datetime import datetime
+from uuid import uuid4
 
 import pytest
 
@@ -15,13 +15,13 @@ async def test_task_comments(client, test_space):
     """Test task comment operations."""
     # Create a test list using the resource interface
     test_list = await client.lists.create(
-        name=f"Comment Test List {datetime.now().isoformat()}",
+        name=f"Comment Test List {uuid4()}",
         space_id=test_space.id,
     )
 
     # Create a test task using the resource interface
     task = await client.tasks.create(
-        name=f"Comment Test Task {datetime.now().isoformat()}",
+        name=f"Comment Test Task {uuid4()}",
         list_id=test_list.id,
         description="Test task for comments",
     )
@@ -87,7 +87,7 @@ async def test_list_comments(client, test_space):
     """Test list comment operations."""
     # Create a test list using the resource interface
     test_list = await client.lists.create(
-        name=f"List Comment Test {datetime.now().isoformat()}",
+        name=f"List Comment Test {uuid4()}",
         space_id=test_space.id,
     )
 
@@ -135,13 +135,13 @@ async def test_comment_pagination(client, test_space):
     """Test comment pagination functionality."""
     # Create a test list using the resource interface
     test_list = await client.lists.create(
-        name=f"Pagination Test List {datetime.now().isoformat()}",
+        name=f"Pagination Test List {uuid4()}",
         space_id=test_space.id,
     )
 
     # Create a test task using the resource interface
     task = await client.tasks.create(
-        name=f"Pagination Test Task {datetime.now().isoformat()}",
+        name=f"Pagination Test Task {uuid4()}",
         list_id=test_list.id,
         description="Test task for comment pagination",
     )
@@ -190,13 +190,13 @@ async def test_comment_with_assignee(client, test_space):
     """Test comment operations with assignees."""
     # Create a test list using the resource interface
     test_list = await client.lists.create(
-        name=f"Assignee Test List {datetime.now().isoformat()}",
+        name=f"Assignee Test List {uuid4()}",
         space_id=test_space.id,
     )
 
     # Create a test task using the resource interface
     task = await client.tasks.create(
-        name=f"Assignee Test Task {datetime.now().isoformat()}",
+        name=f"Assignee Test Task {uuid4()}",
         list_id=test_list.id,
         description="Test task for comment assignees",
     )
@@ -1,6 +1,6 @@
 """Integration tests for custom fields functionality."""
 
-from datetime import datetime
+from uuid import uuid4
 
 import pytest
 import pytest_asyncio
@@ -9,7 +9,7 @@ import pytest_asyncio
 @pytest_asyncio.fixture(scope="module")
 async def test_space(client, workspace):
     """Create a test space for custom fields testing."""
-    space_name = f"Test Space {datetime.now().strftime('%Y%m%d%H%M%S')}"
+    space_name = f"Test Space {uuid4()}"
     space = await client.spaces.create_space(
         name=space_name,
         workspace_id=workspace.id,
@@ -25,7 +25,7 @@ async def test_space(client, workspace):
 @pytest_asyncio.fixture(scope="module")
 async def test_list(client, test_space):
     """Create a test list in the test space."""
-    list_name = f"Test List {datetime.now().strftime('%Y%m%d%H%M%S')}"
+    list_name = f"Test List {uuid4()}"
     task_list = await client.lists.create(
         name=list_name,
         space_id=test_space.id,
@@ -39,7 +39,7 @@ async def test_list(client, test_space):
 @pytest_asyncio.fixture(scope="module")
 async def test_task(client, test_list):
     """Create a test task in the test list."""
-    task_name = f"Test Task {datetime.now().strftime('%Y%m%d%H%M%S')}"
+    task_name = f"Test Task {uuid4()}"
     task = await client.tasks.create(
         name=task_name,
         list_id=test_list.id,
@@ -58,3 +58,16 @@ async def test_custom_task_types_no_workspace_id(client):
 
     with pytest.raises(ValueError, match="Workspace ID must be provided"):
         await test_client.workspaces.get_custom_task_types()
+
+
+@pytest.mark.asyncio
+async def test_custom_task_types_cache(client, workspace):
+    """Test that custom task types are reused until invalidated."""
+    first = await client.workspaces.get_custom_task_types(workspace.id)
+    second = await client.workspaces.get_custom_task_types(workspace.id)
+    assert second == first
+    assert second is not first  # Callers get their own list
+
+    client.workspaces.invalidate_custom_task_types(workspace.id)
+    refreshed = await client.workspaces.get_custom_task_types(workspace.id)
+    assert all(isinstance(item, CustomItem) for item in refreshed)
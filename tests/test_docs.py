@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from datetime import datetime
+from uuid import uuid4
 
 import pytest
 import pytest_asyncio
@@ -10,15 +10,13 @@ import pytest_asyncio
 from src.exceptions import ResourceNotFound
 from src.models import Doc, DocPage, DocPageListing
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
 @pytest_asyncio.fixture
 async def test_doc(client, workspace):
     """Create a test doc for testing."""
-    doc_name = f"Test Doc {datetime.now().strftime('%Y%m%d%H%M%S')}"
+    doc_name = f"Test Doc {uuid4()}"
     logger.info(f"Creating test doc: {doc_name}")
     doc = await client.docs.create(
         name=doc_name,
@@ -32,7 +30,7 @@ async def test_doc(client, workspace):
 @pytest_asyncio.fixture
 async def test_page(client, workspace, test_doc):
     """Create a test page for testing."""
-    page_name = f"Test Page {datetime.now().strftime('%Y%m%d%H%M%S')}"
+    page_name = f"Test Page {uuid4()}"
     logger.info(f"Creating test page: {page_name}")
     page = await client.docs.create_page(
         name=page_name,
@@ -106,7 +104,7 @@ async def test_docs_workflow(client, workspace, test_doc, test_page):
         # 8. Update page
         logger.info(f"Updating page: {test_page.id}")
         await asyncio.sleep(3)  # Longer sleep before update
-        updated_name = f"Updated Page {datetime.now().strftime('%Y%m%d%H%M%S')}"
+        updated_name = f"Updated Page {uuid4()}"
         updated_page = await client.docs.update_page(
             page_id=test_page.id,
             doc_id=test_doc.id,
@@ -1,17 +1,76 @@
 import asyncio
 from datetime import datetime, timedelta
+from uuid import uuid4
 
 import pytest
+import pytest_asyncio
 
 from src.exceptions import ResourceNotFound
 from src.models import KeyResultType
 
+# One key result configuration per key result type under test
+KR_CONFIGS = [
+    {
+        "name": "Number KR",
+        "type": KeyResultType.NUMBER,
+        "steps_start": 0,
+        "steps_end": 100,
+        "unit": "items",
+    },
+    {
+        "name": "Percentage KR",
+        "type": KeyResultType.PERCENTAGE,
+        "steps_start": 0,
+        "steps_end": 100,
+        "unit": "%",
+    },
+    {
+        "name": "Currency KR",
+        "type": KeyResultType.CURRENCY,
+        "steps_start": 0,
+        "steps_end": 1000,
+        "unit": "USD",
+    },
+]
+
+
+def skip_if_plan_limited(error: Exception) -> None:
+    """Skip the current test if the error comes from Goals free-plan limits."""
+    error_message = str(error).lower()
+    if (
+        "free forever plan" in error_message
+        or "100 usages" in error_message
+        or "upgrade" in error_message
+    ):
+        print("Skipping test: Goals feature is limited in free plan")
+        pytest.skip("Goals feature is limited in free plan")
+
+
+@pytest_asyncio.fixture(scope="module")
+async def kr_parent_goal(client, workspace):
+    """Create one goal for the key result tests in this module to share."""
+    try:
+        goal = await client.goals.create(
+            name=f"KR Parent Goal {uuid4()}",
+            due_date=datetime.now() + timedelta(days=7),
+            description="Shared goal for key result tests",
+            workspace_id=workspace.id,
+        )
+    except Exception as e:
+        skip_if_plan_limited(e)
+        raise
+    yield goal
+    try:
+        await client.goals.delete(goal.id)
+    except Exception as e:
+        print(f"Error deleting goal: {str(e)}")
+
 
 @pytest.mark.asyncio
 async def test_goal_crud_operations(client, workspace):
     """Test creating, reading, updating, and deleting goals."""
     # Create a goal
-    name = f"Test Goal {datetime.now()}"
+    name = f"Test Goal {uuid4()}"
     due_date = datetime.now() + timedelta(days=7)
     description = "Test goal description"
 
@@ -31,7 +90,7 @@ async def test_goal_crud_operations(client, workspace):
     assert retrieved_goal.name == name
 
     # Update the goal
-    new_name = f"Updated Goal {datetime.now()}"
+    new_name = f"Updated Goal {uuid4()}"
     updated_goal = await client.goals.update(
         goal_id=created_goal.id,
         name=new_name,
@@ -51,223 +110,136 @@ async def test_goal_crud_operations(client, workspace):
 
 
 @pytest.mark.asyncio
-async def test_key_result_crud_operations(client, workspace):
+async def test_key_result_crud_operations(client, kr_parent_goal):
     """Test creating, reading, updating, and deleting key results."""
-    # First create a goal to add key results to
-    goal = await client.goals.create(
-        name=f"Test Goal for KR {datetime.now()}",
-        due_date=datetime.now() + timedelta(days=7),
-        description="Test goal for key results",
-        workspace_id=workspace.id,
-    )
+    goal = kr_parent_goal
 
-    try:
-        # Create a key result
-        name = f"Test Key Result {datetime.now()}"
-        kr_type = KeyResultType.NUMBER
-        steps_start = 0
-        steps_end = 100
-        unit = "points"
-
-        created_kr = await client.goals.create_key_result(
-            goal_id=goal.id,
-            name=name,
-            type=kr_type,
-            steps_start=steps_start,
-            steps_end=steps_end,
-            unit=unit,
-        )
+    # Create a key result
+    name = f"Test Key Result {uuid4()}"
+    kr_type = KeyResultType.NUMBER
+    steps_start = 0
+    steps_end = 100
+    unit = "points"
 
-        assert created_kr.name == name
-        assert created_kr.type == kr_type
-        assert created_kr.steps_start == steps_start
-        assert created_kr.steps_end == steps_end
-        assert created_kr.unit == unit
-
-        # Update the key result
-        new_steps_current = 50
-        updated_kr = await client.goals.update_key_result(
-            key_result_id=created_kr.id,
-            steps_current=new_steps_current,
-        )
-        assert updated_kr.steps_current == new_steps_current
+    created_kr = await client.goals.create_key_result(
+        goal_id=goal.id,
+        name=name,
+        type=kr_type,
+        steps_start=steps_start,
+        steps_end=steps_end,
+        unit=unit,
+    )
 
-        # Delete the key result
-        assert await client.goals.delete_key_result(created_kr.id)
+    assert created_kr.name == name
+    assert created_kr.type == kr_type
+    assert created_kr.steps_start == steps_start
+    assert created_kr.steps_end == steps_end
+    assert created_kr.unit == unit
+
+    # Update the key result
+    new_steps_current = 50
+    updated_kr = await client.goals.update_key_result(
+        key_result_id=created_kr.id,
+        steps_current=new_steps_current,
+    )
+    assert updated_kr.steps_current == new_steps_current
 
-        # Verify the goal still exists after key result deletion
-        goal_after = await client.goals.get(goal.id)
-        assert goal_after.id == goal.id
+    # Delete the key result
+    assert await client.goals.delete_key_result(created_kr.id)
 
-    finally:
-        # Clean up by deleting the goal
-        await client.goals.delete(goal.id)
+    # Verify the goal still exists after key result deletion
+    goal_after = await client.goals.get(goal.id)
+    assert goal_after.id == goal.id
 
 
 @pytest.mark.asyncio
-async def test_goal_with_multiple_key_results(client, workspace):
+async def test_goal_with_multiple_key_results(client, kr_parent_goal):
     """Test managing multiple key results for a single goal."""
+    goal = kr_parent_goal
     print("\n=== Starting Multiple Key Results Test ===")
-    print(f"Using workspace ID: {workspace.id}")
+    print(f"Using goal ID: {goal.id}")
 
-    # Create a goal
-    print("\nAttempting to create goal...")
+    print("\nCreating key results...")
     try:
-        goal = await client.goals.create(
-            name=f"Multi KR Goal {datetime.now()}",
-            due_date=datetime.now() + timedelta(days=7),
-            description="Goal with multiple key results",
-            workspace_id=workspace.id,
+        key_results = await asyncio.gather(
+            *[
+                client.goals.create_key_result(goal_id=goal.id, **config)
+                for config in KR_CONFIGS
+            ]
         )
-        print(f"Created goal: {goal}")
     except Exception as e:
-        error_message = str(e).lower()
-        if (
-            "free forever plan" in error_message
-            or "100 usages" in error_message
-            or "upgrade" in error_message
-        ):
-            print("Skipping test: Goals feature is limited in free plan")
-            pytest.skip("Goals feature is limited in free plan")
-        print(f"Error creating goal: {str(e)}")
+        skip_if_plan_limited(e)
+        print(f"Error creating key results: {str(e)}")
         raise
 
+    print("\nVerifying key results...")
+    # Verify all key results were created with correct types
+    for kr, config in zip(key_results, KR_CONFIGS):
+        print(f"\nVerifying key result: {kr.name}")
+        print(f"Expected type: {config['type']}, Got type: {kr.type}")
+        print(f"Expected unit: {config['unit']}, Got unit: {kr.unit}")
+        print(f"Full key result data: {kr.model_dump_json(indent=2)}")
+        assert (
+            kr.name == config["name"]
+        ), f"Name mismatch: expected {config['name']}, got {kr.name}"
+        assert (
+            kr.type == config["type"]
+        ), f"Type mismatch: expected {config['type']}, got {kr.type}"
+        assert (
+            kr.unit == config["unit"]
+        ), f"Unit mismatch: expected {config['unit']}, got {kr.unit}"
+        print("Verification passed!")
+
+    print("\nUpdating key result progress...")
+    # Update progress on all key results
+    expected_progress = [kr.steps_end // 2 for kr in key_results]
     try:
-        # Create multiple key results of different types
-        kr_configs = [
-            {
-                "name": "Number KR",
-                "type": KeyResultType.NUMBER,
-                "steps_start": 0,
-                "steps_end": 100,
-                "unit": "items",
-            },
-            {
-                "name": "Percentage KR",
-                "type": KeyResultType.PERCENTAGE,
-                "steps_start": 0,
-                "steps_end": 100,
-                "unit": "%",
-            },
-            {
-                "name": "Currency KR",
-                "type": KeyResultType.CURRENCY,
-                "steps_start": 0,
-                "steps_end": 1000,
-                "unit": "USD",
-            },
-        ]
-
-        print("\nCreating key results...")
-        key_results = []
-        for config in kr_configs:
-            print(f"\nCreating key result with config: {config}")
-            try:
-                kr = await client.goals.create_key_result(goal_id=goal.id, **config)
-                print(f"Created key result: {kr}")
-                key_results.append(kr)
-                await asyncio.sleep(1)  # Small delay between creations
-            except Exception as e:
-                error_message = str(e).lower()
-                if (
-                    "free forever plan" in error_message
-                    or "100 usages" in error_message
-                    or "upgrade" in error_message
-                ):
-                    print("Skipping test: Goals feature is limited in free plan")
-                    pytest.skip("Goals feature is limited in free plan")
-                print(f"Error creating key result {config['name']}: {str(e)}")
-                raise
-
-        print("\nVerifying key results...")
-        # Verify all key results were created with correct types
-        for kr, config in zip(key_results, kr_configs):
-            print(f"\nVerifying key result: {kr.name}")
-            print(f"Expected type: {config['type']}, Got type: {kr.type}")
-            print(f"Expected unit: {config['unit']}, Got unit: {kr.unit}")
-            print(f"Full key result data: {kr.model_dump_json(indent=2)}")
-            assert (
-                kr.name == config["name"]
-            ), f"Name mismatch: expected {config['name']}, got {kr.name}"
-            assert (
-                kr.type == config["type"]
-            ), f"Type mismatch: expected {config['type']}, got {kr.type}"
-            assert (
-                kr.unit == config["unit"]
-            ), f"Unit mismatch: expected {config['unit']}, got {kr.unit}"
-            print("Verification passed!")
-
-        print("\nUpdating key result progress...")
-        # Update progress on all key results
-        for kr in key_results:
-            print(f"\nUpdating progress for key result: {kr.name}")
-            expected_progress = kr.steps_end // 2
-            print(f"Setting progress to: {expected_progress}")
-            try:
-                updated_kr = await client.goals.update_key_result(
-                    key_result_id=kr.id,
-                    steps_current=expected_progress,
-                )
-                print(f"Updated key result: {updated_kr}")
-                print(
-                    f"Full updated key result data: {updated_kr.model_dump_json(indent=2)}"
+        updated_krs = await asyncio.gather(
+            *[
+                client.goals.update_key_result(
+                    key_result_id=kr.id, steps_current=progress
                 )
-                assert (
-                    updated_kr.steps_current == expected_progress
-                ), f"Progress mismatch: expected {expected_progress}, got {updated_kr.steps_current}"
-                await asyncio.sleep(1)  # Small delay between updates
-            except Exception as e:
-                error_message = str(e).lower()
-                if (
-                    "free forever plan" in error_message
-                    or "100 usages" in error_message
-                    or "upgrade" in error_message
-                ):
-                    print("Skipping test: Goals feature is limited in free plan")
-                    pytest.skip("Goals feature is limited in free plan")
-                print(f"Error updating key result {kr.name}: {str(e)}")
-                raise
-
-        print("\nDeleting key results...")
-        # Delete all key results
-        for kr in key_results:
-            print(f"\nDeleting key result: {kr.name}")
-            try:
-                result = await client.goals.delete_key_result(kr.id)
-                print(f"Deletion result: {result}")
-                assert result, f"Failed to delete key result {kr.name}"
-                print("Deletion successful!")
-                await asyncio.sleep(1)  # Small delay between deletions
-            except Exception as e:
-                error_message = str(e).lower()
-                if (
-                    "free forever plan" in error_message
-                    or "100 usages" in error_message
-                    or "upgrade" in error_message
-                ):
-                    print("Skipping test: Goals feature is limited in free plan")
-                    pytest.skip("Goals feature is limited in free plan")
-                print(f"Error deleting key result {kr.name}: {str(e)}")
-                raise
+                for kr, progress in zip(key_results, expected_progress)
+            ]
+        )
+    except Exception as e:
+        skip_if_plan_limited(e)
+        print(f"Error updating key results: {str(e)}")
+        raise
+    for updated_kr, progress in zip(updated_krs, expected_progress):
+        print(f"Full updated key result data: {updated_kr.model_dump_json(indent=2)}")
+        assert (
+            updated_kr.steps_current == progress
+        ), f"Progress mismatch: expected {progress}, got {updated_kr.steps_current}"
+
+    print("\nDeleting key results...")
+    # Delete all key results
+    try:
+        results = await asyncio.gather(
+            *[client.goals.delete_key_result(kr.id) for kr in key_results]
+        )
+    except Exception as e:
+        skip_if_plan_limited(e)
+        print(f"Error deleting key results: {str(e)}")
+        raise
+    for kr, result in zip(key_results, results):
+        assert result, f"Failed to delete key result {kr.name}"
+    print("Deletion successful!")
 
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "kr_config", KR_CONFIGS, ids=["number", "percentage", "currency"]
+)
+async def test_single_key_result_type(client, kr_parent_goal, kr_config):
+    """Test creating and deleting one key result of each type."""
+    try:
+        kr = await client.goals.create_key_result(
+            goal_id=kr_parent_goal.id, **kr_config
+        )
     except Exception as e:
-        print(f"\nTest failed with error: {str(e)}")
+        skip_if_plan_limited(e)
         raise
-    finally:
-        print("\nCleaning up goal...")
-        try:
-            # Clean up by deleting the goal
-            if "goal" in locals():
-                await client.goals.delete(goal.id)
-                print("Goal deleted successfully!")
-        except Exception as e:
-            error_message = str(e).lower()
-            if (
-                "free forever plan" in error_message
-                or "100 usages" in error_message
-                or "upgrade" in error_message
-            ):
-                print("Skipping cleanup: Goals feature is limited in free plan")
-            else:
-                print(f"Error deleting goal: {str(e)}")
-        print("\n=== Test Completed ===")
+    assert kr.type == kr_config["type"]
+    assert kr.unit == kr_config["unit"]
+    assert await client.goals.delete_key_result(kr.id)
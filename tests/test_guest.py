@@ -23,8 +23,6 @@ import pytest_asyncio
 from src import ClickUp, Folder, Guest, Task, TaskList
 from src.exceptions import ClickUpError, ResourceNotFound, ValidationError
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger("clickup")
 
 # --- Test Setup & Skipping --- #
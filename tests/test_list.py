@@ -10,17 +10,17 @@ To run these tests, you need to set up the following environment variables:
 import asyncio
 import logging
 import os
-from datetime import datetime
+from typing import cast
+from uuid import uuid4
 
 import pytest
 import pytest_asyncio
 from dotenv import load_dotenv
 
-from src import ClickUp, TaskList
+from src import Folder, TaskList
 from src.exceptions import ClickUpError, ResourceNotFound, ValidationError
+from tests.helpers import wait_for
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger("clickup")
 
 # Load environment variables from .env file
@@ -37,86 +37,74 @@ pytestmark = pytest.mark.skipif(
 )
 
 
-@pytest_asyncio.fixture
-async def client():
-    """Create a ClickUp client instance for testing."""
-    if not API_TOKEN:
-        pytest.skip("API token not set")
-    client = ClickUp(API_TOKEN)
-    yield client
-    await client.close()
+@pytest_asyncio.fixture(scope="module")
+async def shared_folder(scratchpad) -> Folder:
+    """Provide one folder for this module's lists, deleted at the end of the session."""
+    return await scratchpad.take_folder(cast(str, SPACE_ID))
 
 
 @pytest.mark.asyncio
-async def test_list_crud_operations(client):
+async def test_list_crud_operations(client, shared_folder):
     """Test CRUD operations for lists."""
-    # First create a folder
-    folder_name = f"Test Folder {datetime.now().isoformat()}"
-    folder = await client.folders.create(
-        name=folder_name,
-        space_id=SPACE_ID,
+    # Create a test list in the shared folder
+    list_name = f"Test List {uuid4()}"
+    created_list = await client.lists.create(
+        name=list_name,
+        folder_id=shared_folder.id,
+    )
+    assert isinstance(created_list, TaskList)
+    assert created_list.name == list_name
+    assert (
+        created_list.folder is not None and created_list.folder.id == shared_folder.id
     )
 
-    try:
-        # Create a test list in the folder
-        list_name = f"Test List {datetime.now().isoformat()}"
-        created_list = await client.lists.create(
-            name=list_name,
-            folder_id=folder.id,
-        )
-        assert isinstance(created_list, TaskList)
-        assert created_list.name == list_name
-        assert created_list.folder is not None and created_list.folder.id == folder.id
-
-        # Wait a moment for the list to be fully created
-        await asyncio.sleep(2)
-
-        # Get list details
-        retrieved_list = await client.lists.get(created_list.id)
-        assert isinstance(retrieved_list, TaskList)
-        assert retrieved_list.id == created_list.id
-        assert retrieved_list.name == list_name
-
-        # Update list
-        new_name = f"Updated List {datetime.now().isoformat()}"
-        updated_list = await client.lists.update(
-            list_id=created_list.id,
-            name=new_name,
-            content="Updated list description",
-        )
-        assert isinstance(updated_list, TaskList)
-        assert updated_list.id == created_list.id
-        assert updated_list.name == new_name
-        assert updated_list.content == "Updated list description"
-
-        # Wait a moment for the update to propagate
-        await asyncio.sleep(2)
-
-        # Verify update
-        retrieved_list = await client.lists.get(created_list.id)
-        assert retrieved_list.name == new_name
-        assert retrieved_list.content == "Updated list description"
-
-        # Delete list
-        result = await client.lists.delete(created_list.id)
-        assert result is True
-
-        # Wait for deletion to propagate
-        await asyncio.sleep(2)
+    # Get list details once the list is fully created
+    retrieved_list = await wait_for(
+        lambda: client.lists.get(created_list.id),
+        lambda task_list: task_list is not None and task_list.name == list_name,
+    )
+    assert isinstance(retrieved_list, TaskList)
+    assert retrieved_list.id == created_list.id
+    assert retrieved_list.name == list_name
+
+    # Update list
+    new_name = f"Updated List {uuid4()}"
+    updated_list = await client.lists.update(
+        list_id=created_list.id,
+        name=new_name,
+        content="Updated list description",
+    )
+    assert isinstance(updated_list, TaskList)
+    assert updated_list.id == created_list.id
+    assert updated_list.name == new_name
+    assert updated_list.content == "Updated list description"
 
-        # Check what we actually get back after deletion
-        deleted_list = await client.lists.get(created_list.id)
-        print(f"List after deletion: {deleted_list}")
-    finally:
-        # Clean up the folder
-        await client.folders.delete(folder.id)
+    # Verify update once it has propagated
+    retrieved_list = await wait_for(
+        lambda: client.lists.get(created_list.id),
+        lambda task_list: task_list is not None and task_list.name == new_name,
+    )
+    assert retrieved_list is not None
+    assert retrieved_list.name == new_name
+    assert retrieved_list.content == "Updated list description"
+
+    # Delete list
+    result = await client.lists.delete(created_list.id)
+    assert result is True
+
+    # Check what we actually get back once the deletion has propagated
+    deleted_list = await wait_for(
+        lambda: client.lists.get(created_list.id),
+        lambda task_list: task_list is None or task_list.archived,
+    )
+    print(f"List after deletion: {deleted_list}")
 
 
 @pytest.mark.asyncio
 async def test_list_markdown_support(client):
     """Test list operations with markdown support."""
     # Create a test list with markdown content
-    list_name = f"Markdown Test List {datetime.now().isoformat()}"
+    list_name = f"Markdown Test List {uuid4()}"
     task_list = await client.lists.create(
         name=list_name,
         space_id=SPACE_ID,
@@ -142,16 +130,12 @@ async def test_list_markdown_support(client):
 async def test_multiple_list_operations(client):
     """Test operations related to Tasks in Multiple Lists feature."""
     # Create two test lists
-    list1_name = f"Multiple List Test 1 {datetime.now().isoformat()}"
-    list2_name = f"Multiple List Test 2 {datetime.now().isoformat()}"
+    list1_name = f"Multiple List Test 1 {uuid4()}"
+    list2_name = f"Multiple List Test 2 {uuid4()}"
 
-    list1 = await client.lists.create(
-        name=list1_name,
-        space_id=SPACE_ID,
-    )
-    list2 = await client.lists.create(
-        name=list2_name,
-        space_id=SPACE_ID,
+    list1, list2 = await asyncio.gather(
+        client.lists.create(name=list1_name, space_id=SPACE_ID),
+        client.lists.create(name=list2_name, space_id=SPACE_ID),
     )
 
     # Wait for lists to be potentially indexed, though direct access is confirmed below
@@ -174,7 +158,7 @@ async def test_multiple_list_operations(client):
     # Create a test task in the first list
     logger.info(f"Attempting to create task in list {list1.id}")
     task = await client.tasks.create(
-        name=f"Multiple List Test Task {datetime.now().isoformat()}",
+        name=f"Multiple List Test Task {uuid4()}",
         list_id=list1.id,
         description="Test task for multiple list operations",
     )
@@ -205,10 +189,13 @@ async def test_multiple_list_operations(client):
                 )
             raise
     finally:
-        # Clean up
-        await client.tasks.delete(task.id)
-        await client.lists.delete(list1.id)
-        await client.lists.delete(list2.id)
+        # Clean up; one failed delete must not stop the others
+        await asyncio.gather(
+            client.tasks.delete(task.id),
+            client.lists.delete(list1.id),
+            client.lists.delete(list2.id),
+            return_exceptions=True,
+        )
 
 
 @pytest.mark.skip(reason="Requires a valid template ID to run")
@@ -223,7 +210,7 @@ async def test_list_template_operations(client):
     4. Remove the @pytest.mark.skip decorator
     """
     template_id = "your_template_id"  # Replace with actual template ID
-    list_name = f"Template List {datetime.now().isoformat()}"
+    list_name = f"Template List {uuid4()}"
 
     # Create list from template
     list_from_template = await client.lists.create_from_template(
@@ -252,7 +239,7 @@ async def test_list_template_operations(client):
 async def test_list_fluent_interface(client):
     """Test the fluent interface for list operations."""
     # Create a test list using fluent interface
-    list_name = f"Fluent Test List {datetime.now().isoformat()}"
+    list_name = f"Fluent Test List {uuid4()}"
     task_list = await client.lists.create(name=list_name, space_id=SPACE_ID)
     assert task_list is not None
     assert task_list.name == list_name
@@ -265,7 +252,7 @@ async def test_list_fluent_interface(client):
     assert list_details.name == list_name
 
     # Update list using fluent interface
-    new_name = f"Fluent Updated List {datetime.now().isoformat()}"
+    new_name = f"Fluent Updated List {uuid4()}"
     updated_list = await client.list(task_list.id).update(name=new_name)
     assert updated_list is not None
     assert updated_list.id == task_list.id
@@ -279,7 +266,7 @@ async def test_list_fluent_interface(client):
 async def test_list_archived_operations(client):
     """Test operations with archived lists."""
     # Create a test list
-    list_name = f"Archive Test List {datetime.now().isoformat()}"
+    list_name = f"Archive Test List {uuid4()}"
     task_list = await client.lists.create(
         name=list_name,
         space_id=SPACE_ID,
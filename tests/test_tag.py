@@ -13,8 +13,6 @@ import pytest_asyncio
 from src import ClickUp, Space, Task
 from src.exceptions import ResourceNotFound, ValidationError
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger("clickup")
 
 # Mark all tests in this module as asyncio
@@ -17,8 +17,6 @@ from src import ClickUp, Task
 from src.exceptions import ResourceNotFound
 from src.models import PaginatedResponse, Priority, TaskList
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("clickup.tests.tasks")
 
 # Load environment variables from .env file
@@ -1,7 +1,8 @@
 """
 Integration tests for ClickUp time tracking operations.
 
-These tests verify that the client works correctly with the real ClickUp API.
+These tests verify that the client works correctly with the real ClickUp API; the
+running-timer cache tests at the end run offline against httpx.MockTransport.
 To run these tests, you need to set up the following environment variables:
 - CLICKUP_API_TOKEN: Your ClickUp API token
 - CLICKUP_WORKSPACE_ID: ID of a workspace to test with
@@ -13,14 +14,13 @@ from datetime import datetime, timedelta
 from typing import AsyncGenerator, List
 from uuid import uuid4
 
+import httpx
 import pytest
 import pytest_asyncio
 
 from src import ClickUp, Task, TimeEntry
 from src.exceptions import ClickUpError, ResourceNotFound, ValidationError
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger("clickup")
 
 # Mark all tests in this module as asyncio
@@ -317,3 +317,97 @@ async def test_delete_time_entry(client: ClickUp, test_task: Task):
         await client.time.get_entry(
             time_entry_id=str(entry.id), workspace_id=str(test_task.team_id)
         )
+
+
+def running_timer_handler(release=None):
+    """Answer the running-timer endpoint with entries e1, e2, ... in turn.
+
+    Once ``release`` is given, requests after the first wait until it is set.
+    """
+    seen = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if release is not None and len(seen) > 1:
+            await release.wait()
+        return httpx.Response(200, json={"data": {"id": f"e{len(seen)}"}})
+
+    return handler, seen
+
+
+async def test_running_entry_served_stale_while_refreshing(mock_client):
+    """A cached timer past running_entry_ttl is returned and refreshed behind."""
+    handler, _ = running_timer_handler()
+    client = mock_client(handler, running_entry_ttl=0, running_entry_max_age=60)
+
+    first = await client.time.get_running_entry(workspace_id="w1")
+    stale = await client.time.get_running_entry(workspace_id="w1")
+    await asyncio.gather(*client.time._running_refreshes.values())
+    refreshed = await client.time.get_running_entry(workspace_id="w1")
+
+    assert (first.id, stale.id, refreshed.id) == ("e1", "e1", "e2")
+
+
+async def test_running_entry_refetched_past_max_age(mock_client):
+    """A cached timer older than running_entry_max_age is fetched again inline."""
+    handler, seen = running_timer_handler()
+    client = mock_client(handler, running_entry_ttl=0, running_entry_max_age=0)
+
+    first = await client.time.get_running_entry(workspace_id="w1")
+    second = await client.time.get_running_entry(workspace_id="w1")
+
+    assert (first.id, second.id) == ("e1", "e2")
+    assert len(seen) == 2
+    assert not client.time._running_refreshes
+
+
+async def test_delete_entry_clears_running_entry(mock_client):
+    """A running timer deleted through the resource is not served from the cache."""
+    deleted = False
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal deleted
+        if request.method == "DELETE":
+            deleted = True
+            return httpx.Response(200, json={"data": [{"id": "e1"}]})
+        return httpx.Response(200, json={"data": None if deleted else {"id": "e1"}})
+
+    client = mock_client(handler, running_entry_ttl=60, running_entry_max_age=60)
+
+    assert (await client.time.get_running_entry(workspace_id="w1")).id == "e1"
+    await client.time.delete_entry("e1", workspace_id="w1")
+
+    assert await client.time.get_running_entry(workspace_id="w1") is None
+
+
+async def test_close_cancels_running_entry_refreshes(mock_client):
+    """close() cancels background refreshes instead of leaving them pending."""
+    handler, _ = running_timer_handler(release=asyncio.Event())
+    client = mock_client(handler, running_entry_ttl=0, running_entry_max_age=60)
+
+    await client.time.get_running_entry(workspace_id="w1")
+    await client.time.get_running_entry(workspace_id="w1")
+    (refresh,) = client.time._running_refreshes.values()
+    await asyncio.sleep(0.01)  # Refresh is now waiting in the handler
+
+    await client.close()
+
+    assert refresh.cancelled()
+    assert not client.time._running_refreshes
+
+
+async def test_start_timer_validates_response(mock_client):
+    """start_timer coerces the API's data unless fast_construct is enabled."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, json={"data": {"id": "e1", "duration": "-1500", "at": "1700000000"}}
+        )
+
+    client = mock_client(handler)
+
+    entry = await client.time.start_timer(task_id="t1", workspace_id="w1")
+
+    assert entry.duration == -1500
+    assert entry.at == 1700000000
+    assert (entry.task_id, entry.wid) == ("t1", "w1")
@@ -1,23 +1,27 @@
 """
 Integration tests for ClickUp view operations.
 
-These tests verify that the client works correctly with the real ClickUp API.
+These tests verify that the client works correctly with the real ClickUp API; the
+view task pagination tests at the end run offline against httpx.MockTransport.
 To run these tests, you need to set up the following environment variables:
 - CLICKUP_API_TOKEN: Your ClickUp API token
 - CLICKUP_WORKSPACE_ID: ID of a workspace to test with
 """
 
+import asyncio
+import gc
+import json
 import logging
 from uuid import uuid4
 
+import httpx
 import pytest
 import pytest_asyncio
 
 from src import ClickUp, View
 from src.exceptions import ClickUpError, ResourceNotFound, ValidationError
+from src.models import ListViewsResult
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger("clickup")
 
 # Mark all tests in this module as asyncio
@@ -52,18 +56,31 @@ async def test_get_list_views(client: ClickUp, test_list):
     """Test getting list views."""
     view_data = await client.views.get_list_views(list_id=test_list.id)
 
-    assert isinstance(view_data, dict)
-    assert "views" in view_data
-    assert "required_views" in view_data
+    assert isinstance(view_data, ListViewsResult)
 
-    for view in view_data["views"]:
+    for view in view_data.views:
         assert isinstance(view, View)
 
     # Required views are returned as strings
-    for view_type in view_data["required_views"]:
+    for view_type in view_data.required_views:
         assert isinstance(view_type, str)
 
 
+async def test_get_all_views(
+    client: ClickUp, workspace, test_space, test_folder, test_list
+):
+    """Test getting views across workspace, space, folder and list levels."""
+    views = await client.views.get_all_views(
+        workspace_id=workspace.id,
+        space_ids=[test_space.id],
+        folder_ids=[test_folder.id],
+        list_ids=[test_list.id],
+    )
+    assert isinstance(views, list)
+    for view in views:
+        assert isinstance(view, View)
+
+
 async def test_create_list_view(client: ClickUp, test_list):
     """Test creating a list view."""
     view_name = f"Test List View {uuid4()}"
@@ -83,6 +100,16 @@ async def test_create_list_view(client: ClickUp, test_list):
         await client.views.delete_view(view_id=created_view.id)
 
 
+async def test_create_view_invalid_type(client: ClickUp, test_list):
+    """Test that an unsupported view type is rejected before any request."""
+    with pytest.raises(ValueError, match="Invalid view type"):
+        await client.views.create_list_view(
+            name=f"Test Invalid View {uuid4()}",
+            type="spreadsheet",  # type: ignore[arg-type]
+            list_id=test_list.id,
+        )
+
+
 async def test_update_view(client: ClickUp, test_list):
     """Test updating a view."""
     # First create a view
@@ -133,6 +160,27 @@ async def test_delete_view(client: ClickUp, test_list):
             await client.views.get_view(view_id=created_view.id)
 
 
+async def test_iter_view_tasks(client: ClickUp, test_list, test_task):
+    """Test iterating over all tasks in a view."""
+    created_view = await client.views.create_list_view(
+        name=f"Test View to Iterate {uuid4()}",
+        type="list",
+        list_id=test_list.id,
+    )
+
+    try:
+        if created_view.id:
+            tasks = [
+                task async for task in client.views.iter_view_tasks(created_view.id)
+            ]
+            assert any(task["id"] == test_task.id for task in tasks)
+
+    finally:
+        # Clean up
+        if created_view.id:
+            await client.views.delete_view(view_id=created_view.id)
+
+
 async def test_view_fluent_interface(client: ClickUp, workspace):
     """Test using the view with fluent interface."""
     # Get views using fluent interface without using workspace().views
@@ -144,3 +192,106 @@ async def test_view_fluent_interface(client: ClickUp, workspace):
         view = await client.views.get_view(view_id=views[0].id)
         assert isinstance(view, View)
         assert view.id == views[0].id
+
+
+async def test_iter_view_tasks_stops_at_last_page(mock_client):
+    """Iteration ends at the page flagged last_page, without fetching past it."""
+    pages = {
+        0: {"tasks": [{"id": "t1"}, {"id": "t2"}], "last_page": False},
+        1: {"tasks": [{"id": "t3"}], "last_page": True},
+        2: {"tasks": [], "last_page": True},
+    }
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(int(request.url.params["page"]))
+        return httpx.Response(200, json=pages[requested[-1]])
+
+    client = mock_client(handler)
+
+    tasks = [task async for task in client.views.iter_view_tasks("v1")]
+
+    assert [task["id"] for task in tasks] == ["t1", "t2", "t3"]
+    assert requested == [0, 1]
+
+
+async def test_create_view_sends_only_view_fields(mock_client):
+    """Create requests carry name, type and the provided settings, nothing else."""
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(json.loads(request.content))
+        return httpx.Response(
+            200, json={"view": {"id": "v1", "name": "Board", "type": "board"}}
+        )
+
+    client = mock_client(handler)
+
+    view = await client.views.create_list_view(
+        "Board", "board", list_id="l1", filters={"op": "AND"}
+    )
+
+    assert view.id == "v1"
+    assert sent == [{"name": "Board", "type": "board", "filters": {"op": "AND"}}]
+
+
+async def _collect(tasks):
+    """Gather every task an iterator yields."""
+    return [task async for task in tasks]
+
+
+async def test_iter_view_tasks_stops_at_empty_page(mock_client):
+    """An empty page ends iteration even when last_page is false."""
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(int(request.url.params["page"]))
+        if requested[-1] == 0:
+            return httpx.Response(
+                200, json={"tasks": [{"id": "t1"}], "last_page": False}
+            )
+        return httpx.Response(200, json={"tasks": [], "last_page": False})
+
+    client = mock_client(handler)
+
+    tasks = await asyncio.wait_for(
+        _collect(client.views.iter_view_tasks("v1")), timeout=1
+    )
+
+    assert [task["id"] for task in tasks] == ["t1"]
+    assert requested == [0, 1]
+
+
+async def test_iter_view_tasks_settles_prefetch_on_early_exit(mock_client):
+    """Closing the iterator early cancels the prefetch and waits for it to finish."""
+    release = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params["page"] != "0":
+            await release.wait()
+        return httpx.Response(200, json={"tasks": [{"id": "t1"}], "last_page": False})
+
+    client = mock_client(handler)
+    loop = asyncio.get_running_loop()
+    reported = []
+    previous_handler = loop.get_exception_handler()
+    loop.set_exception_handler(lambda _, context: reported.append(context))
+    try:
+        tasks = client.views.iter_view_tasks("v1")
+        assert (await tasks.__anext__())["id"] == "t1"
+        await asyncio.sleep(0.01)  # The prefetch of page 1 is now in flight
+        prefetches = [
+            task
+            for task in asyncio.all_tasks()
+            if "_get_view_tasks_page" in repr(task.get_coro())
+        ]
+        await tasks.aclose()
+
+        assert prefetches and all(task.cancelled() for task in prefetches)
+        del tasks, prefetches
+        gc.collect()
+    finally:
+        release.set()
+        loop.set_exception_handler(previous_handler)
+
+    assert reported == []
@@ -22,8 +22,6 @@ import pytest_asyncio
 from src import ClickUp, Webhook
 from src.exceptions import ClickUpError, ResourceNotFound, ValidationError
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger("clickup")
 
 # Mark all tests in this module as asyncio
@@ -2,9 +2,11 @@
 Tests for ClickUp workspace operations.
 """
 
+import httpx
 import pytest
 
-from src.models import Workspace
+from src.exceptions import ValidationError
+from src.models import CustomItem, Workspace, WorkspaceBundle
 
 
 @pytest.mark.asyncio
@@ -24,6 +26,16 @@ async def test_get_workspace(client, workspace):
     assert workspace_details.name == workspace.name
 
 
+@pytest.mark.asyncio
+async def test_get_workspace_bundle(client, workspace):
+    """Test getting a workspace with its custom task types and fields."""
+    bundle = await client.workspaces.get_workspace_bundle(workspace.id)
+    assert isinstance(bundle, WorkspaceBundle)
+    assert bundle.workspace.id == workspace.id
+    assert all(isinstance(item, CustomItem) for item in bundle.custom_task_types)
+    assert isinstance(bundle.custom_fields, list)
+
+
 @pytest.mark.asyncio
 async def test_workspace_fluent_interface(client, workspace):
     """Test the fluent interface for workspace operations."""
@@ -32,3 +44,13 @@ async def test_workspace_fluent_interface(client, workspace):
     assert isinstance(workspace_details, Workspace)
     assert workspace_details.id == workspace.id
     assert workspace_details.name == workspace.name
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("body", [b"", b"{}"])
+async def test_get_workspace_without_team(mock_client, body):
+    """A response without a workspace raises the library's ValidationError."""
+    client = mock_client(lambda request: httpx.Response(200, content=body))
+
+    with pytest.raises(ValidationError):
+        await client.workspaces.get_workspace("w1")